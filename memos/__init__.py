@@ -9,8 +9,20 @@ __version__ = "0.1.0"
 __author__ = "MemOS AI Team"
 __email__ = "contact@memos-ai.org"
 
-from memos.core import MemOSEngine
-from memos.entities import MemeEntity
-from memos.config import Config
+__all__ = ["MemOSEngine", "MemeEntity", "Config"]
 
-__all__ = ["MemOSEngine", "MemeEntity", "Config"] 
\ No newline at end of file
+# Public names are resolved on first access so that importing a light
+# submodule (e.g. memos.config for the CLI) does not load the model stack
+_LAZY_IMPORTS = {
+    "MemOSEngine": "memos.core",
+    "MemeEntity": "memos.entities",
+    "Config": "memos.config",
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}") 
\ No newline at end of file
@@ -3,12 +3,20 @@ API module for MemOS AI Framework.
 """
 
 from typing import Dict, Any, List, Optional
-from pathlib import Path
-import tempfile
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import asyncio
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
 from pydantic import BaseModel
+import orjson
+from starlette.concurrency import iterate_in_threadpool
 import uvicorn
 
 from memos.core import MemOSEngine
@@ -16,17 +24,113 @@ from memos.entities import MemeEntity
 from memos.config import Config
 from memos.utils.logger import get_logger
 
+# Initialize global components; the engine itself is built on startup
+config = Config()
+logger = get_logger(__name__)
+
+# Only compress responses large enough to benefit
+GZIP_MINIMUM_SIZE = 1024  # bytes
+
+# Event streams must reach clients event by event, so they are never compressed
+UNCOMPRESSED_PATH_SUFFIXES = ("/interact/stream",)
+
+# Uploads are read in chunks so oversized files are rejected early
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # bytes
+
+# Response cache settings for the read-only entity endpoints
+CACHE_NAMESPACE = "memes"
+STATUS_CACHE_TTL = 5  # seconds
+LIST_CACHE_TTL = 10  # seconds
+
+def _init_cache(config: Config) -> None:
+    """
+    Initialize the response cache.
+
+    Each worker process has its own engine, so responses are cached in
+    process memory; a shared backend would serve one worker's entities
+    from another.
+    """
+    FastAPICache.init(InMemoryBackend(), prefix=config.get("api.cache.prefix"))
+
+def _cache_key_builder(func, namespace: str = "", request: Request = None,
+                       response=None, args=(), kwargs=None) -> str:
+    """Build cache keys from route parameters, ignoring injected dependencies."""
+    params = sorted(
+        (name, value) for name, value in (kwargs or {}).items()
+        if name != "engine"
+    )
+    # The namespace already carries the cache prefix, which clear() matches on
+    return f"{namespace}:{func.__name__}:{params}"
+
+def _streaming_enabled(engine: MemOSEngine) -> bool:
+    """Check whether streamed interactions are enabled for the engine."""
+    return bool(engine.config.get("features.llm_integration.streaming", False))
+
+async def _invalidate_cache() -> None:
+    """Drop cached entity responses after a mutation."""
+    await FastAPICache.clear(namespace=CACHE_NAMESPACE)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build the engine once the event loop is running.
+
+    Deferring construction to startup keeps module import cheap and means
+    each worker process loads its models after forking, not before.
+    """
+    # Engine calls are blocking and run on the default executor
+    executor = ThreadPoolExecutor(max_workers=config.get("processing.num_workers"))
+    asyncio.get_running_loop().set_default_executor(executor)
+
+    _init_cache(config)
+
+    app.state.engine = MemOSEngine(config)
+    yield
+    executor.shutdown(wait=False)
+
+class _StreamAwareGZipMiddleware:
+    """
+    GZip middleware that leaves server-sent event streams uncompressed.
+
+    GZip buffers its output, so a compressed event stream reaches the
+    client in large batches instead of one event at a time.
+    """
+
+    def __init__(self, app, minimum_size: int = GZIP_MINIMUM_SIZE):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and scope["path"].endswith(UNCOMPRESSED_PATH_SUFFIXES):
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
+def get_engine(request: Request) -> MemOSEngine:
+    """Dependency returning the engine owned by the running app."""
+    return request.app.state.engine
+
 # Initialize FastAPI app
 app = FastAPI(
     title="MemOS AI API",
     description="API for transforming static memes into interactive digital entities",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
+)
+app.add_middleware(_StreamAwareGZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=config.get("api.cors_origins"),
+    allow_methods=["*"],
+    allow_headers=["*"]
 )
 
-# Initialize global components
-config = Config()
-engine = MemOSEngine(config)
-logger = get_logger(__name__)
+@app.exception_handler(Exception)
+async def handle_unexpected_error(request: Request, exc: Exception) -> ORJSONResponse:
+    """Log unhandled errors and report them as HTTP 500 responses."""
+    logger.exception("Failed to handle %s %s", request.method, request.url.path)
+    return ORJSONResponse(status_code=500, content={"detail": str(exc)})
 
 # Pydantic models for request/response
 class InteractionRequest(BaseModel):
@@ -58,8 +162,30 @@ async def root():
         "status": "active"
     }
 
+async def _read_upload(file: UploadFile, max_size: int) -> bytes:
+    """
+    Read an uploaded file, rejecting it once it exceeds the size limit.
+
+    Args:
+        file: Uploaded file.
+        max_size: Maximum accepted size in bytes.
+
+    Returns:
+        bytes: The file contents.
+    """
+    chunks = []
+    size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            raise HTTPException(status_code=413, detail=f"Upload exceeds {max_size} bytes")
+        chunks.append(chunk)
+    
+    return b"".join(chunks)
+
 @app.post("/memes/upload", response_model=EntityStatus)
-async def upload_meme(file: UploadFile = File(...)):
+async def upload_meme(file: UploadFile = File(...),
+                      engine: MemOSEngine = Depends(get_engine)):
     """
     Upload and process a new meme image.
     
@@ -69,35 +195,27 @@ async def upload_meme(file: UploadFile = File(...)):
     Returns:
         EntityStatus: Status of the created entity.
     """
-    try:
-        # Create temporary file
-        suffix = Path(file.filename).suffix
-        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-            content = await file.read()
-            temp_file.write(content)
-            temp_path = temp_file.name
-        
-        # Create and activate entity
-        entity = MemeEntity.from_image(temp_path)
-        success = engine.activate(entity)
-        
-        if not success:
-            raise HTTPException(status_code=500, detail="Failed to activate meme entity")
-        
-        # Get entity status
-        status = engine.get_entity_status(entity.id)
-        
-        # Clean up temporary file
-        Path(temp_path).unlink()
-        
-        return status
-        
-    except Exception as e:
-        logger.error(f"Failed to process uploaded meme: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Starlette already spools large uploads to disk, so the encoded
+    # bytes are decoded directly instead of copying them to a temp file
+    data = await _read_upload(file, config.get("api.max_upload_size") * 1024 * 1024)
+    
+    # Create and activate entity
+    entity = await asyncio.to_thread(MemeEntity.from_bytes, data)
+    success = await engine.activate_async(entity)
+    
+    if not success:
+        raise HTTPException(status_code=500, detail="Failed to activate meme entity")
+    
+    # Get entity status
+    status = await asyncio.to_thread(engine.get_entity_status, entity.id)
+    await _invalidate_cache()
+    
+    return status
 
 @app.post("/memes/{entity_id}/interact", response_model=InteractionResponse)
-async def interact_with_meme(entity_id: str, interaction: InteractionRequest):
+async def interact_with_meme(entity_id: str,
+                             interaction: InteractionRequest,
+                             engine: MemOSEngine = Depends(get_engine)):
     """
     Interact with a meme entity.
     
@@ -108,26 +226,58 @@ async def interact_with_meme(entity_id: str, interaction: InteractionRequest):
     Returns:
         InteractionResponse: Response from the entity.
     """
-    try:
-        # Validate entity exists
-        if entity_id not in engine.get_active_entities():
-            raise HTTPException(status_code=404, detail="Entity not found")
-        
-        # Process interaction
-        response = engine.interact(entity_id, interaction.dict())
-        
-        return InteractionResponse(
-            entity_id=entity_id,
-            response=response,
-            status="success"
-        )
-        
-    except Exception as e:
-        logger.error(f"Failed to process interaction: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Validate entity exists
+    if not engine.is_active(entity_id):
+        raise HTTPException(status_code=404, detail="Entity not found")
+    
+    # Process interaction
+    response = await asyncio.to_thread(engine.interact, entity_id, interaction.model_dump())
+    await _invalidate_cache()
+    
+    # The engine output is trusted, so skip re-validating the response model
+    return InteractionResponse.model_construct(
+        entity_id=entity_id,
+        response=response,
+        status="success"
+    )
+
+@app.post("/memes/{entity_id}/interact/stream")
+async def stream_interaction(entity_id: str,
+                             interaction: InteractionRequest,
+                             engine: MemOSEngine = Depends(get_engine)):
+    """
+    Interact with a meme entity, streaming results as server-sent events.
+    
+    Each processing stage is sent as soon as it completes, so clients see
+    the emotional reaction before the full response has been generated.
+    
+    Args:
+        entity_id: ID of the target entity.
+        interaction: Interaction details.
+    
+    Returns:
+        StreamingResponse: Event stream of interaction stages.
+    """
+    if not _streaming_enabled(engine):
+        raise HTTPException(status_code=404, detail="Streaming is disabled")
+    
+    # Validate entity exists
+    if not engine.is_active(entity_id):
+        raise HTTPException(status_code=404, detail="Entity not found")
+    
+    async def events():
+        stages = engine.interact_stream(entity_id, interaction.model_dump())
+        async for stage in iterate_in_threadpool(stages):
+            payload = orjson.dumps(stage["data"], default=str).decode()
+            yield f"event: {stage['event']}\ndata: {payload}\n\n"
+        await _invalidate_cache()
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
 
 @app.get("/memes/{entity_id}", response_model=EntityStatus)
-async def get_meme_status(entity_id: str):
+@cache(expire=STATUS_CACHE_TTL, namespace=CACHE_NAMESPACE, key_builder=_cache_key_builder)
+async def get_meme_status(entity_id: str,
+                          engine: MemOSEngine = Depends(get_engine)):
     """
     Get status of a meme entity.
     
@@ -138,33 +288,25 @@ async def get_meme_status(entity_id: str):
         EntityStatus: Current status of the entity.
     """
     try:
-        return engine.get_entity_status(entity_id)
+        return await asyncio.to_thread(engine.get_entity_status, entity_id)
     except ValueError:
         raise HTTPException(status_code=404, detail="Entity not found")
-    except Exception as e:
-        logger.error(f"Failed to get entity status: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/memes", response_model=List[EntityStatus])
-async def list_memes():
+@cache(expire=LIST_CACHE_TTL, namespace=CACHE_NAMESPACE, key_builder=_cache_key_builder)
+async def list_memes(engine: MemOSEngine = Depends(get_engine)):
     """
     List all active meme entities.
     
     Returns:
         List[EntityStatus]: List of active entity statuses.
     """
-    try:
-        active_ids = engine.get_active_entities()
-        return [
-            engine.get_entity_status(entity_id)
-            for entity_id in active_ids
-        ]
-    except Exception as e:
-        logger.error(f"Failed to list entities: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    active_ids = engine.get_active_entities()
+    return await asyncio.to_thread(engine.get_entity_statuses, active_ids)
 
 @app.delete("/memes/{entity_id}")
-async def deactivate_meme(entity_id: str):
+async def deactivate_meme(entity_id: str,
+                          engine: MemOSEngine = Depends(get_engine)):
     """
     Deactivate a meme entity.
     
@@ -174,32 +316,52 @@ async def deactivate_meme(entity_id: str):
     Returns:
         dict: Deactivation status.
     """
-    try:
-        success = engine.deactivate(entity_id)
-        if not success:
-            raise HTTPException(status_code=404, detail="Entity not found")
-        
-        return {"status": "success", "message": f"Entity {entity_id} deactivated"}
-        
-    except Exception as e:
-        logger.error(f"Failed to deactivate entity: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    success = await asyncio.to_thread(engine.deactivate, entity_id)
+    if not success:
+        raise HTTPException(status_code=404, detail="Entity not found")
+    await _invalidate_cache()
+    
+    return {"status": "success", "message": f"Entity {entity_id} deactivated"}
 
 def start_server(host: str = "localhost", 
                 port: int = 8000, 
-                reload: bool = False) -> None:
+                reload: bool = False,
+                workers: int = 1,
+                access_log: bool = False) -> None:
     """
     Start the API server.
     
+    Active entities live in the engine of the worker process that created
+    them, so the server runs a single worker by default. With more workers
+    a request can reach a process that does not hold the entity and get a
+    404, so only raise it once entity state is kept outside the process.
+    For process management the same app can be served through Gunicorn:
+
+        gunicorn -k uvicorn.workers.UvicornWorker -w <workers> memos.api:app
+    
     Args:
         host: Host address to bind to.
         port: Port number to listen on.
         reload: Whether to enable auto-reload.
+        workers: Number of worker processes. Defaults to 1 because entities
+            are not shared between workers. Ignored when reload is enabled.
+        access_log: Whether to log every request. Off by default since
+            per-request logging is a noticeable share of request cost.
     """
+    # Prefer uvloop's libuv-based event loop; it is not available on Windows
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "auto"
+
     uvicorn.run(
         "memos.api:app",
         host=host,
         port=port,
         reload=reload,
+        workers=None if reload else workers,
+        loop=loop,
+        access_log=access_log,
         log_level="info"
     ) 
\ No newline at end of file
@@ -3,15 +3,21 @@ Command-line interface for MemOS AI Framework.
 """
 
 import argparse
+import logging
 import sys
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
-from memos.core import MemOSEngine
-from memos.entities import MemeEntity
 from memos.config import Config
 from memos.utils.logger import get_logger
 
+# The engine pulls in the vision and LLM stacks, so it is only imported by
+# the commands that need it
+if TYPE_CHECKING:
+    from memos.core import MemOSEngine
+
 def create_parser() -> argparse.ArgumentParser:
     """Create command-line argument parser."""
     parser = argparse.ArgumentParser(
@@ -30,6 +36,12 @@ def create_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Enable verbose output"
     )
+    parser.add_argument(
+        "--server",
+        type=str,
+        help="URL of a running MemOS API server (e.g. http://localhost:8000); "
+             "commands are sent to it instead of a local engine"
+    )
     
     # Subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -84,8 +96,53 @@ def create_parser() -> argparse.ArgumentParser:
         help="List active meme entities"
     )
     
+    # Serve command
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Run the API server, keeping the engine warm for --server commands"
+    )
+    serve_parser.add_argument(
+        "--host",
+        type=str,
+        default="localhost",
+        help="Host address to bind to"
+    )
+    serve_parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port number to listen on"
+    )
+    serve_parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (entities are not shared between workers)"
+    )
+    
     return parser
 
+@lru_cache(maxsize=None)
+def _engine_for(config_path: Optional[str]) -> "MemOSEngine":
+    """Build the engine for a configuration file once per process."""
+    from memos.core import MemOSEngine
+
+    return MemOSEngine(Config(config_path))
+
+def _api_request(args: argparse.Namespace, method: str, path: str, **kwargs) -> Any:
+    """Send a request to the MemOS API server given by --server."""
+    import requests
+
+    response = requests.request(method, args.server.rstrip("/") + path, **kwargs)
+    response.raise_for_status()
+    return response.json()
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson does not handle natively."""
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
+
 def init_project(args: argparse.Namespace, logger: logging.Logger) -> int:
     """
     Initialize a new MemOS project.
@@ -131,34 +188,35 @@ def process_meme(args: argparse.Namespace, logger: logging.Logger) -> int:
         int: Exit code.
     """
     try:
-        # Load configuration
-        config = Config(args.config)
-        
-        # Initialize engine
-        engine = MemOSEngine(config)
-        
-        # Create meme entity
-        entity = MemeEntity.from_image(args.image_path)
-        
-        # Activate entity
-        success = engine.activate(entity)
-        if not success:
-            logger.error("Failed to activate meme entity")
-            return 1
-        
-        # Get entity status
-        status = engine.get_entity_status(entity.id)
+        if args.server:
+            with open(args.image_path, "rb") as f:
+                status = _api_request(args, "POST", "/memes/upload", files={"file": f})
+        else:
+            from memos.entities import MemeEntity
+
+            engine = _engine_for(args.config)
+            
+            # Create meme entity
+            entity = MemeEntity.from_image(args.image_path)
+            
+            # Activate entity
+            success = engine.activate(entity)
+            if not success:
+                logger.error("Failed to activate meme entity")
+                return 1
+            
+            # Get entity status
+            status = engine.get_entity_status(entity.id)
         
         # Save results if output path specified
         if args.output:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            import json
-            with open(output_path, "w") as f:
-                json.dump(status, f, indent=4)
+            import orjson
+            output_path.write_bytes(orjson.dumps(status, option=orjson.OPT_INDENT_2, default=_json_default))
         
-        logger.info(f"Successfully processed meme: {entity.id}")
+        logger.info(f"Successfully processed meme: {status['id']}")
         return 0
         
     except Exception as e:
@@ -177,12 +235,6 @@ def interact_with_meme(args: argparse.Namespace, logger: logging.Logger) -> int:
         int: Exit code.
     """
     try:
-        # Load configuration
-        config = Config(args.config)
-        
-        # Initialize engine
-        engine = MemOSEngine(config)
-        
         # Create interaction
         interaction = {
             "type": "text",
@@ -190,7 +242,12 @@ def interact_with_meme(args: argparse.Namespace, logger: logging.Logger) -> int:
         }
         
         # Send interaction
-        response = engine.interact(args.entity_id, interaction)
+        if args.server:
+            response = _api_request(
+                args, "POST", f"/memes/{args.entity_id}/interact", json=interaction
+            )["response"]
+        else:
+            response = _engine_for(args.config).interact(args.entity_id, interaction)
         
         # Print response
         print(response)
@@ -212,21 +269,18 @@ def list_entities(args: argparse.Namespace, logger: logging.Logger) -> int:
         int: Exit code.
     """
     try:
-        # Load configuration
-        config = Config(args.config)
-        
-        # Initialize engine
-        engine = MemOSEngine(config)
-        
-        # Get active entities
-        active_ids = engine.get_active_entities()
+        # Get active entity statuses
+        if args.server:
+            statuses = _api_request(args, "GET", "/memes")
+        else:
+            engine = _engine_for(args.config)
+            statuses = engine.get_entity_statuses(engine.get_active_entities())
         
         # Print entity information
-        print(f"\nActive Meme Entities ({len(active_ids)}):")
+        print(f"\nActive Meme Entities ({len(statuses)}):")
         print("-" * 40)
         
-        for entity_id in active_ids:
-            status = engine.get_entity_status(entity_id)
+        for status in statuses:
             print(f"ID: {status['id']}")
             print(f"Status: {status['status']}")
             print(f"Created: {status['creation_time']}")
@@ -238,6 +292,23 @@ def list_entities(args: argparse.Namespace, logger: logging.Logger) -> int:
         logger.error(f"Failed to list entities: {str(e)}")
         return 1
 
+def serve(args: argparse.Namespace, logger: logging.Logger) -> int:
+    """
+    Run the API server.
+
+    Args:
+        args: Command-line arguments.
+        logger: Logger instance.
+
+    Returns:
+        int: Exit code.
+    """
+    from memos.api import start_server
+
+    logger.info(f"Starting MemOS API server on {args.host}:{args.port}")
+    start_server(host=args.host, port=args.port, workers=args.workers)
+    return 0
+
 def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI.
@@ -264,6 +335,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         return interact_with_meme(args, logger)
     elif args.command == "list":
         return list_entities(args, logger)
+    elif args.command == "serve":
+        return serve(args, logger)
     else:
         parser.print_help()
         return 1
@@ -2,11 +2,14 @@
 Configuration module for MemOS AI Framework.
 """
 
+import copy
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 import json
 
+import orjson
+
 from memos.utils.logger import get_logger
 
 class Config:
@@ -38,7 +41,8 @@ class Config:
                 "format": "wav"
             },
             "batch_size": 32,
-            "num_workers": 4
+            "num_workers": 4,
+            "history_max": 1024
         },
         "models": {
             "vision": {
@@ -108,16 +112,25 @@ class Config:
             "cache_dir": "cache",
             "max_cache_size": 1024,  # MB
             "media_dir": "media",
-            "temp_dir": "temp"
+            "temp_dir": "temp",
+            "activation_cache": {
+                "enabled": False,
+                "dir": None,  # Defaults to ~/.cache/memos/activation
+                "max_size": 256  # MB
+            }
         },
         "api": {
             "host": "localhost",
             "port": 8000,
             "debug": False,
             "cors_origins": ["*"],
+            "max_upload_size": 20,  # MB
             "rate_limit": {
                 "requests": 100,
                 "period": 60  # seconds
+            },
+            "cache": {
+                "prefix": "memos-cache"
             }
         },
         "features": {
@@ -172,30 +185,36 @@ class Config:
         }
     }
 
+    # First characters of values that may decode as JSON
+    _JSON_START_CHARS = frozenset('{["-0123456789tfn')
+
     def __init__(self, config_path: Optional[str] = None):
         """Initialize configuration."""
         self.logger = get_logger(__name__)
-        self._config = self.DEFAULTS.copy()
+        self._config = copy.deepcopy(self.DEFAULTS)
         self._update_from_env()
         
         if config_path:
             self._load_from_file(config_path)
         
+        self._flat = self._flatten(self._config)
         self._setup_directories()
         self.logger.info("Configuration initialized successfully")
 
     def _update_from_env(self) -> None:
         """Update configuration from environment variables."""
         env_prefix = "MEMOS_"
-        for key in os.environ:
-            if key.startswith(env_prefix):
-                config_key = key[len(env_prefix):].lower()
-                value = os.environ[key]
+        for key, value in os.environ.items():
+            if not key.startswith(env_prefix):
+                continue
+            config_key = key[len(env_prefix):].lower()
+            # Only attempt JSON decoding for values that could be JSON
+            if value and value[0] in self._JSON_START_CHARS:
                 try:
                     value = json.loads(value)
                 except json.JSONDecodeError:
                     pass
-                self._set_nested_value(config_key.split("_"), value)
+            self._set_nested_value(config_key.split("_"), value)
 
     def _load_from_file(self, config_path: str) -> None:
         """Load configuration from file."""
@@ -213,12 +232,16 @@ class Config:
             self.logger.error(f"Failed to load configuration file: {str(e)}")
 
     def _update_recursive(self, base: Dict, update: Dict) -> None:
-        """Recursively update nested dictionary."""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                self._update_recursive(base[key], value)
-            else:
-                base[key] = value
+        """Deep-merge update into a nested dictionary without recursing."""
+        stack = [(base, update)]
+        while stack:
+            base, update = stack.pop()
+            for key, value in update.items():
+                current = base.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    base[key] = value
 
     def _set_nested_value(self, keys: list, value: Any) -> None:
         """Set value in nested dictionary using key path."""
@@ -229,6 +252,16 @@ class Config:
             current = current[key]
         current[keys[-1]] = value
 
+    def _flatten(self, config: Dict, prefix: str = "") -> Dict[str, Any]:
+        """Map every dotted key path, including intermediate sections, to its value."""
+        flat = {}
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, f"{path}."))
+        return flat
+
     def _setup_directories(self) -> None:
         """Create necessary directories."""
         root_dir = Path(self._config["storage"]["root_dir"])
@@ -241,17 +274,12 @@ class Config:
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value."""
-        try:
-            value = self._config
-            for k in key.split("."):
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        return self._flat.get(key, default)
 
     def set(self, key: str, value: Any) -> None:
         """Set configuration value."""
         self._set_nested_value(key.split("."), value)
+        self._flat = self._flatten(self._config)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary."""
@@ -263,8 +291,7 @@ class Config:
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
         try:
-            with open(config_path, "w") as f:
-                json.dump(self._config, f, indent=4)
+            config_path.write_bytes(orjson.dumps(self._config, option=orjson.OPT_INDENT_2))
             self.logger.info(f"Saved configuration to {config_path}")
         except Exception as e:
             self.logger.error(f"Failed to save configuration: {str(e)}")
@@ -0,0 +1,174 @@
+"""
+On-disk cache of meme activation results.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+import orjson
+
+from memos.entities import MemeEntity
+from memos.utils import logger
+
+def default_cache_dir() -> Path:
+    """Get the per-user activation cache directory (``~/.cache/memos/activation``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "memos" / "activation"
+
+class ActivationCache:
+    """
+    Stores the state produced by activating a meme, keyed by its content.
+
+    Activation output depends only on the image, the metadata supplied with
+    it and the engine configuration, so a meme seen before can be restored
+    from a snapshot instead of running the full pipeline again. Snapshots
+    live in a two-level sharded directory and the least recently used ones
+    are evicted once the cache grows past its size limit.
+    """
+
+    # Bump whenever the snapshot layout or the activation pipeline changes,
+    # so snapshots written by older versions are never restored
+    SCHEMA_VERSION = 1
+
+    def __init__(self, cache_dir: str, max_size: int, config_data: Dict[str, Any]):
+        """
+        Initialize the ActivationCache.
+
+        Args:
+            cache_dir: Directory holding the snapshots
+            max_size: Maximum total size of the snapshots in megabytes
+            config_data: The configuration settings activation output depends on
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size * 1024 * 1024
+        self.logger = logger.get_logger(__name__)
+
+        # The configuration is fixed for the engine's lifetime
+        self._config_digest = hashlib.blake2b(
+            orjson.dumps(
+                {"schema": self.SCHEMA_VERSION, "config": config_data},
+                option=orjson.OPT_SORT_KEYS, default=str
+            ),
+            digest_size=16
+        ).digest()
+
+        # Running total of snapshot bytes, so stores need not rescan the cache
+        self._size = sum(size for _, size, _ in self._scan())
+
+    def key(self, meme: MemeEntity) -> str:
+        """
+        Build the cache key for a meme.
+
+        Args:
+            meme: The meme entity
+
+        Returns:
+            Hex digest of the meme content, metadata and configuration
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(meme.get_fingerprint())
+        digest.update(orjson.dumps(meme.metadata, option=orjson.OPT_SORT_KEYS, default=str))
+        digest.update(self._config_digest)
+        return digest.hexdigest()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a snapshot.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            The stored snapshot, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                snapshot = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # A truncated or stale snapshot is dropped and rebuilt
+            self.logger.warning("Discarding unreadable activation snapshot: %s", path)
+            self._remove(path)
+            return None
+
+        # Touch the file so eviction sees it as recently used
+        os.utime(path)
+        return snapshot
+
+    def store(self, key: str, snapshot: Dict[str, Any]) -> None:
+        """
+        Store a snapshot, evicting old ones if the cache is full.
+
+        Args:
+            key: Cache key from key()
+            snapshot: Activation state to store
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first so readers never see partial data
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    size = f.tell()
+                replaced = self._file_size(path)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            self._size += size - replaced
+            if self._size > self.max_size:
+                self._evict()
+        except OSError:
+            # The cache is an optimization; failing to write it is not fatal
+            self.logger.warning("Could not store activation snapshot: %s", path, exc_info=True)
+
+    def _path(self, key: str) -> Path:
+        """Get the snapshot path for a key."""
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def _file_size(self, path: Path) -> int:
+        """Get the size of a snapshot file, or 0 if it does not exist."""
+        try:
+            return path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def _remove(self, path: Path) -> None:
+        """Delete a snapshot and account for its size."""
+        self._size -= self._file_size(path)
+        path.unlink(missing_ok=True)
+
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) for every snapshot on disk."""
+        entries = []
+        for path in self.cache_dir.glob('*/*.pkl'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used snapshots until the cache fits its limit."""
+        # Rescanning here also corrects the running total for snapshots
+        # written or removed by other processes sharing the directory
+        entries = self._scan()
+        self._size = sum(size for _, size, _ in entries)
+
+        entries.sort()
+        for _, size, path in entries:
+            if self._size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            self._size -= size
\ No newline at end of file
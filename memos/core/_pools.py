@@ -0,0 +1,55 @@
+"""
+Object pools for frequently allocated core structures.
+"""
+
+from collections import deque
+from typing import Dict, Any, Optional
+
+class ContextPool:
+    """
+    Free list of context dictionaries.
+
+    Contexts released on cleanup are cleared and handed out again by
+    ``acquire``, so activating new memes reuses already-sized dicts.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize the ContextPool.
+
+        Args:
+            max_size: Maximum number of idle contexts kept for reuse
+        """
+        # deque append/pop are atomic, so the pool is safe to share
+        # between the API's worker threads without a lock
+        self._free = deque(maxlen=max_size)
+
+    def acquire(self) -> Dict[str, Any]:
+        """
+        Take an empty context from the pool, creating one if none is idle.
+
+        Returns:
+            Empty context dictionary
+        """
+        try:
+            return self._free.pop()
+        except IndexError:
+            return {}
+
+    def release(self, context: Optional[Dict[str, Any]]) -> None:
+        """
+        Clear a context and return it to the pool.
+
+        Only the top-level dict is cleared; nested values may be shared
+        with the configuration or the entity and are simply dropped.
+
+        Args:
+            context: Context dictionary no longer referenced by any meme
+        """
+        if not isinstance(context, dict):
+            return
+        context.clear()
+        self._free.append(context)
+
+    def __len__(self) -> int:
+        return len(self._free)
\ No newline at end of file
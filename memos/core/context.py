@@ -2,9 +2,13 @@
 Context management module for MemOS AI.
 """
 
+from collections import deque
+import time
 from typing import Dict, Any, Optional
 from memos.entities import MemeEntity
 from memos.utils import logger
+from memos.utils.timestamps import to_isoformat
+from ._pools import ContextPool
 
 class ContextManager:
     """
@@ -21,6 +25,9 @@ class ContextManager:
         """
         self.config = config or {}
         self.logger = logger.get_logger(__name__)
+        self._pool = ContextPool()
+        self._history_max = self.config.get('processing.history_max', 1024)
+        self._mode = self.config.get('mode', 'production')
 
     def create_context(self, meme: MemeEntity) -> Dict[str, Any]:
         """
@@ -33,18 +40,21 @@ class ContextManager:
             Initial context dictionary
         """
         try:
-            context = {
+            # Reuse a context dict released by a deactivated meme if possible
+            context = self._pool.acquire()
+            context.update({
                 'creation_time': self._get_timestamp(),
+                'interaction_history': deque(maxlen=self._history_max),
                 'environment': self._get_environment(),
                 'initial_state': self._get_initial_state(meme),
                 'metadata': self._get_metadata(meme)
-            }
+            })
             
-            self.logger.info(f"Created context for meme: {meme.id}")
+            self.logger.info("Created context for meme: %s", meme.id)
             return context
             
-        except Exception as e:
-            self.logger.error(f"Error creating context for meme {meme.id}: {str(e)}")
+        except Exception:
+            self.logger.exception("Error creating context for meme %s", meme.id)
             raise
 
     def update_context(self, meme: MemeEntity, interaction: Dict[str, Any]) -> None:
@@ -55,30 +65,26 @@ class ContextManager:
             meme: The meme entity
             interaction: Interaction data
         """
-        try:
-            current_context = meme.get_context()
-            
-            # Update interaction history
-            history = current_context.get('interaction_history', [])
-            history.append({
-                'timestamp': self._get_timestamp(),
-                'type': interaction.get('type'),
-                'data': interaction
-            })
-            
-            # Update context state
-            current_context.update({
-                'last_interaction': self._get_timestamp(),
-                'interaction_history': history,
-                'current_state': self._analyze_current_state(meme, interaction)
-            })
-            
-            # Set updated context
-            meme.set_context(current_context)
-            
-        except Exception as e:
-            self.logger.error(f"Error updating context for meme {meme.id}: {str(e)}")
-            raise
+        current_context = meme.get_context()
+        timestamp = self._get_timestamp()
+        interaction_type = interaction.get('type')
+        
+        # Update interaction history in place, keeping only the latest entries;
+        # contexts set directly on the entity may not have a history yet
+        history = current_context.setdefault(
+            'interaction_history', deque(maxlen=self._history_max)
+        )
+        history.append({
+            'timestamp': timestamp,
+            'type': interaction_type,
+            'data': interaction
+        })
+        
+        # Update the live context state; no set-back is needed
+        current_context['last_interaction'] = timestamp
+        current_context['current_state'] = self._analyze_current_state(
+            meme, interaction, interaction_type
+        )
 
     def cleanup(self, meme: MemeEntity) -> None:
         """
@@ -91,24 +97,48 @@ class ContextManager:
             # Archive context if needed
             self._archive_context(meme)
             
-            # Clear current context
+            # Clear current context and recycle the old one
+            context = meme.get_context()
             meme.set_context({})
+            self._pool.release(context)
             
-        except Exception as e:
-            self.logger.error(f"Error cleaning up context for meme {meme.id}: {str(e)}")
+        except Exception:
+            self.logger.exception("Error cleaning up context for meme %s", meme.id)
             raise
 
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+    def describe_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a context to plain Python types for serialization.
+        
+        Args:
+            context: Context dictionary
+            
+        Returns:
+            Context with the interaction history as a list and every
+            timestamp formatted as ISO 8601
+        """
+        if not context:
+            return context
+        described = dict(context)
+        for key in ('creation_time', 'last_interaction'):
+            if key in described:
+                described[key] = to_isoformat(described[key])
+        described['interaction_history'] = [
+            {**record, 'timestamp': to_isoformat(record['timestamp'])}
+            for record in context.get('interaction_history', ())
+        ]
+        return described
+
+    def _get_timestamp(self) -> int:
+        """Get current timestamp in epoch nanoseconds."""
+        return time.time_ns()
 
     def _get_environment(self) -> Dict[str, Any]:
         """Get current environment information."""
         return {
             'platform': 'MemOS AI',
             'version': '1.0.0',
-            'mode': self.config.get('mode', 'production')
+            'mode': self._mode
         }
 
     def _get_initial_state(self, meme: MemeEntity) -> Dict[str, Any]:
@@ -116,27 +146,29 @@ class ContextManager:
         return {
             'status': 'initialized',
             'configuration': self.config.get('initial_state', {}),
-            'parameters': meme.parameters
+            'parameters': meme.metadata.get('parameters', {})
         }
 
     def _get_metadata(self, meme: MemeEntity) -> Dict[str, Any]:
         """Get metadata for a meme entity."""
+        metadata = meme.metadata
         return {
-            'creator': meme.creator,
-            'creation_purpose': meme.purpose,
-            'initial_tags': meme.tags,
-            'source': meme.source
+            'creator': metadata.get('creator'),
+            'creation_purpose': metadata.get('purpose'),
+            'initial_tags': metadata.get('tags', []),
+            'source': metadata.get('source')
         }
 
     def _analyze_current_state(
         self,
         meme: MemeEntity,
-        interaction: Dict[str, Any]
+        interaction: Dict[str, Any],
+        interaction_type: Optional[str]
     ) -> Dict[str, Any]:
         """Analyze and return current state based on interaction."""
         return {
             'status': 'active',
-            'last_interaction_type': interaction.get('type'),
+            'last_interaction_type': interaction_type,
             'current_mode': self._determine_mode(interaction),
             'stability': self._assess_stability(meme)
         }
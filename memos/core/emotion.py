@@ -2,15 +2,46 @@
 Emotion engine module for MemOS AI.
 """
 
+from collections import OrderedDict
+import time
 from typing import Dict, Any, Optional, List
+
+from numba import njit
+import numpy as np
+
 from memos.entities import MemeEntity
 from memos.utils import logger
+from memos.utils.timestamps import to_isoformat
+
+@njit(cache=True, fastmath=True)
+def _emotion_update(current, impact, low, high):
+    """Apply an impact vector, returning the new emotions, intensity and stability."""
+    n = current.shape[0]
+    new = np.empty(n, np.float32)
+    total = 0.0
+    change = 0.0
+    for i in range(n):
+        value = current[i] + impact[i]
+        if value < low:
+            value = low
+        elif value > high:
+            value = high
+        new[i] = value
+        total += abs(value)
+        change += abs(value - current[i])
+    return new, total / n, 1.0 - change / n
+
+# Compile on import rather than on the first interaction
+_emotion_update(np.zeros(8, np.float32), np.zeros(8, np.float32), -1.0, 1.0)
 
 class EmotionEngine:
     """
     Manages emotional states and responses for meme entities.
     """
     
+    # Maximum number of meme fingerprints with a memoized base state
+    BASE_STATE_CACHE_SIZE = 1024
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Initialize the EmotionEngine.
@@ -23,10 +54,24 @@ class EmotionEngine:
         
         # Initialize emotion parameters
         self.emotion_range = (-1.0, 1.0)
-        self.base_emotions = [
+        self.base_emotions = (
             'joy', 'sadness', 'anger', 'fear',
             'surprise', 'disgust', 'trust', 'anticipation'
-        ]
+        )
+        
+        # Emotion values are stored as float32 vectors in base_emotions order
+        self._emotion_idx = {
+            emotion: i for i, emotion in enumerate(self.base_emotions)
+        }
+        
+        # Impact depends only on the interaction type, so it is looked up
+        # from a table built once; unknown types share one zero vector
+        self._impact_table = self._build_impact_table(self.config.get('impact_table', {}))
+        self._zero_impact = self._initialize_emotions()
+        self._zero_impact.setflags(write=False)
+        
+        # Base states keyed by meme content fingerprint, in LRU order
+        self._base_state_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
 
     def initialize_state(self, meme: MemeEntity) -> Dict[str, Any]:
         """
@@ -48,11 +93,11 @@ class EmotionEngine:
                 'stability': 1.0
             }
             
-            self.logger.info(f"Initialized emotional state for meme: {meme.id}")
+            self.logger.info("Initialized emotional state for meme: %s", meme.id)
             return state
             
-        except Exception as e:
-            self.logger.error(f"Error initializing emotional state for meme {meme.id}: {str(e)}")
+        except Exception:
+            self.logger.exception("Error initializing emotional state for meme %s", meme.id)
             raise
 
     def process_interaction(
@@ -70,32 +115,77 @@ class EmotionEngine:
         Returns:
             Updated emotional state
         """
-        try:
-            current_state = meme.get_emotional_state()
-            
-            # Analyze interaction impact
-            impact = self._analyze_emotional_impact(interaction)
+        current_state = meme.get_emotional_state()
+        timestamp = self._get_timestamp()
+        
+        # Analyze interaction impact
+        impact = self._analyze_emotional_impact(interaction.get('type', 'neutral'))
+        
+        # Update emotional state
+        new_state = self._update_emotional_state(
+            current_state,
+            impact,
+            timestamp
+        )
+        
+        # Generate response
+        response = self._generate_emotional_response(
+            new_state,
+            interaction,
+            timestamp
+        )
+        
+        # Update meme's emotional state
+        meme.set_emotional_state(new_state)
+        
+        return response
+
+    def process_batch(
+        self,
+        memes: List[MemeEntity],
+        interactions: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several interactions, updating emotional states together.
+        
+        Args:
+            memes: The meme entities, one per interaction
+            interactions: Interaction data, in the order they occurred
             
-            # Update emotional state
-            new_state = self._update_emotional_state(
-                current_state,
-                impact
-            )
+        Returns:
+            Emotional responses in the order of interactions
+        """
+        timestamp = self._get_timestamp()
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(memes)
+        
+        # A meme may appear several times; its updates are applied in
+        # successive rounds so each one sees the previous result
+        pending = list(range(len(memes)))
+        while pending:
+            seen = set()
+            batch, deferred = [], []
+            for i in pending:
+                if memes[i].id in seen:
+                    deferred.append(i)
+                else:
+                    seen.add(memes[i].id)
+                    batch.append(i)
             
-            # Generate response
-            response = self._generate_emotional_response(
-                new_state,
-                interaction
+            new_states = self._update_emotional_states(
+                [memes[i].get_emotional_state() for i in batch],
+                [self._analyze_emotional_impact(interactions[i].get('type', 'neutral')) for i in batch],
+                timestamp
             )
-            
-            # Update meme's emotional state
-            meme.set_emotional_state(new_state)
-            
-            return response
-            
-        except Exception as e:
-            self.logger.error(f"Error processing interaction for meme {meme.id}: {str(e)}")
-            raise
+            for i, new_state in zip(batch, new_states):
+                memes[i].set_emotional_state(new_state)
+                responses[i] = self._generate_emotional_response(
+                    new_state,
+                    interactions[i],
+                    timestamp
+                )
+            pending = deferred
+        
+        return responses
 
     def cleanup(self, meme: MemeEntity) -> None:
         """
@@ -111,83 +201,142 @@ class EmotionEngine:
             # Clear current state
             meme.set_emotional_state({})
             
-        except Exception as e:
-            self.logger.error(f"Error cleaning up emotional state for meme {meme.id}: {str(e)}")
+        except Exception:
+            self.logger.exception("Error cleaning up emotional state for meme %s", meme.id)
             raise
 
-    def _calculate_base_state(self, meme: MemeEntity) -> Dict[str, float]:
-        """Calculate base emotional state from meme content."""
-        return {
-            emotion: self._calculate_emotion_value(meme, emotion)
-            for emotion in self.base_emotions
+    def describe_state(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert an emotional state to plain Python types for serialization.
+        
+        Args:
+            state: Emotional state dictionary
+            
+        Returns:
+            Emotional state with emotion vectors expanded to dictionaries
+            and the timestamp formatted as ISO 8601
+        """
+        if not state:
+            return state
+        described = {
+            key: self._to_emotion_dict(value) if isinstance(value, np.ndarray) else value
+            for key, value in state.items()
         }
+        described['timestamp'] = to_isoformat(state['timestamp'])
+        return described
 
-    def _initialize_emotions(self) -> Dict[str, float]:
-        """Initialize emotion values."""
-        return {
-            emotion: 0.0
-            for emotion in self.base_emotions
-        }
+    def _to_emotion_dict(self, emotions: np.ndarray) -> Dict[str, float]:
+        """Map an emotion vector to emotion names."""
+        return dict(zip(self.base_emotions, emotions.tolist()))
 
-    def _analyze_emotional_impact(
-        self,
-        interaction: Dict[str, Any]
-    ) -> Dict[str, float]:
-        """Analyze emotional impact of an interaction."""
-        impact = {}
-        
-        # Analyze interaction type
-        interaction_type = interaction.get('type', 'neutral')
-        
-        # Calculate impact for each emotion
-        for emotion in self.base_emotions:
-            impact[emotion] = self._calculate_impact(
-                emotion,
-                interaction_type
-            )
+    def _calculate_base_state(self, meme: MemeEntity) -> np.ndarray:
+        """Calculate base emotional state from meme content."""
+        key = meme.get_fingerprint()
+        base_state = self._base_state_cache.get(key)
+        if base_state is not None:
+            self._base_state_cache.move_to_end(key)
+            return base_state
+        
+        base_state = np.array(
+            [self._calculate_emotion_value(meme, emotion) for emotion in self.base_emotions],
+            dtype=np.float32
+        )
+        # The vector is shared between memes with the same content
+        base_state.setflags(write=False)
         
-        return impact
+        self._base_state_cache[key] = base_state
+        if len(self._base_state_cache) > self.BASE_STATE_CACHE_SIZE:
+            self._base_state_cache.popitem(last=False)
+        return base_state
+
+    def _initialize_emotions(self) -> np.ndarray:
+        """Initialize emotion values."""
+        return np.zeros(len(self.base_emotions), dtype=np.float32)
+
+    def _analyze_emotional_impact(self, interaction_type: str) -> np.ndarray:
+        """Analyze emotional impact of an interaction type."""
+        return self._impact_table.get(interaction_type, self._zero_impact)
+
+    def _build_impact_table(self, table: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        """Build impact vectors from a mapping of interaction type to emotion values."""
+        impacts = {}
+        for interaction_type, values in table.items():
+            impact = np.array(values, dtype=np.float32)
+            if impact.shape != (len(self.base_emotions),):
+                raise ValueError(
+                    f"Impact for '{interaction_type}' must have "
+                    f"{len(self.base_emotions)} values, got {impact.size}"
+                )
+            # The vectors are shared between calls, so guard them against mutation
+            impact.setflags(write=False)
+            impacts[interaction_type] = impact
+        return impacts
 
     def _update_emotional_state(
         self,
         current_state: Dict[str, Any],
-        impact: Dict[str, float]
+        impact: np.ndarray,
+        timestamp: int
     ) -> Dict[str, Any]:
         """Update emotional state based on impact."""
-        new_emotions = {}
+        current_emotions = current_state['current_emotions']
         
-        # Update each emotion
-        for emotion in self.base_emotions:
-            current = current_state['current_emotions'][emotion]
-            new_value = current + impact[emotion]
-            
-            # Ensure value is within range
-            new_emotions[emotion] = max(
-                min(new_value, self.emotion_range[1]),
-                self.emotion_range[0]
-            )
+        # Update all emotions in one compiled pass, keeping values within range
+        new_emotions, intensity, stability = _emotion_update(
+            current_emotions, impact, *self.emotion_range
+        )
         
         # Create new state
         return {
-            'timestamp': self._get_timestamp(),
-            'previous_state': current_state['current_emotions'],
+            'timestamp': timestamp,
+            'previous_state': current_emotions,
             'current_emotions': new_emotions,
-            'intensity': self._calculate_intensity(new_emotions),
-            'stability': self._calculate_stability(
-                current_state['current_emotions'],
-                new_emotions
-            )
+            'intensity': intensity,
+            'stability': stability
         }
 
+    def _update_emotional_states(
+        self,
+        current_states: List[Dict[str, Any]],
+        impacts: List[np.ndarray],
+        timestamp: int
+    ) -> List[Dict[str, Any]]:
+        """Update several emotional states with one matrix operation."""
+        # A single interaction, the common case, goes through the compiled
+        # kernel; stacking only pays off for larger batches
+        if len(current_states) == 1:
+            return [self._update_emotional_state(current_states[0], impacts[0], timestamp)]
+        
+        current = np.stack([state['current_emotions'] for state in current_states])
+        new = np.clip(
+            current + np.stack(impacts),
+            self.emotion_range[0],
+            self.emotion_range[1]
+        )
+        intensity = np.abs(new).mean(axis=1)
+        stability = 1.0 - np.abs(new - current).mean(axis=1)
+        
+        return [
+            {
+                'timestamp': timestamp,
+                'previous_state': state['current_emotions'],
+                'current_emotions': new[i],
+                'intensity': float(intensity[i]),
+                'stability': float(stability[i])
+            }
+            for i, state in enumerate(current_states)
+        ]
+
     def _generate_emotional_response(
         self,
         state: Dict[str, Any],
-        interaction: Dict[str, Any]
+        interaction: Dict[str, Any],
+        timestamp: int
     ) -> Dict[str, Any]:
         """Generate emotional response based on current state."""
         return {
-            'timestamp': self._get_timestamp(),
-            'emotional_state': state['current_emotions'],
+            'timestamp': to_isoformat(timestamp),
+            'emotional_state': self._to_emotion_dict(state['current_emotions']),
             'response_type': self._determine_response_type(state),
             'intensity': state['intensity'],
             'stability': state['stability']
@@ -202,36 +351,14 @@ class EmotionEngine:
         # Implement emotion calculation logic
         return 0.0
 
-    def _calculate_impact(self, emotion: str, interaction_type: str) -> float:
-        """Calculate impact of interaction on specific emotion."""
-        # Implement impact calculation logic
-        return 0.0
-
-    def _calculate_intensity(self, emotions: Dict[str, float]) -> float:
-        """Calculate overall emotional intensity."""
-        return sum(abs(v) for v in emotions.values()) / len(emotions)
-
-    def _calculate_stability(
-        self,
-        old_state: Dict[str, float],
-        new_state: Dict[str, float]
-    ) -> float:
-        """Calculate emotional stability."""
-        changes = [
-            abs(new_state[e] - old_state[e])
-            for e in self.base_emotions
-        ]
-        return 1.0 - (sum(changes) / len(changes))
-
     def _determine_response_type(self, state: Dict[str, Any]) -> str:
         """Determine appropriate response type based on emotional state."""
         # Implement response type determination logic
         return 'neutral'
 
-    def _get_timestamp(self) -> str:
-        """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+    def _get_timestamp(self) -> int:
+        """Get current timestamp in epoch nanoseconds."""
+        return time.time_ns()
 
     def _archive_emotional_state(self, meme: MemeEntity) -> None:
         """Archive emotional state data if needed."""
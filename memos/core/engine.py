@@ -2,16 +2,23 @@
 MemOS Engine - The core processing unit of the MemOS AI Framework.
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 
 from memos.entities import MemeEntity
 from memos.core.processor import MemeProcessor
 from memos.core.context import ContextManager
 from memos.core.emotion import EmotionEngine
+from memos.core._activation_cache import ActivationCache, default_cache_dir
 from memos.utils.logger import get_logger
 from memos.config import Config
 
+# Settings that change what activation produces; other settings do not
+# invalidate cached activations
+ACTIVATION_CONFIG_KEYS = ("processing", "impact_table", "initial_state", "mode")
+
 class MemOSEngine:
     """
     The main engine class that orchestrates all MemOS AI operations.
@@ -32,6 +39,15 @@ class MemOSEngine:
         self.context_manager = ContextManager(self.config)
         self.emotion_engine = EmotionEngine(self.config)
         
+        # Reuse activation results for memes seen before
+        self.activation_cache: Optional[ActivationCache] = None
+        if self.config.get("storage.activation_cache.enabled", False):
+            self.activation_cache = ActivationCache(
+                self.config.get("storage.activation_cache.dir") or default_cache_dir(),
+                self.config.get("storage.activation_cache.max_size"),
+                {key: self.config.get(key) for key in ACTIVATION_CONFIG_KEYS}
+            )
+        
         self.active_entities: Dict[str, MemeEntity] = {}
         self.logger.info("MemOS Engine initialized successfully")
 
@@ -46,27 +62,58 @@ class MemOSEngine:
             bool: True if activation was successful, False otherwise.
         """
         try:
-            # Process the meme
-            self.processor.process(meme)
+            # The key is taken before processing, which adds to the metadata
+            cache_key = self.activation_cache.key(meme) if self.activation_cache else None
+            snapshot = self.activation_cache.load(cache_key) if cache_key else None
             
-            # Initialize context
-            context = self.context_manager.create_context(meme)
-            meme.set_context(context)
+            if snapshot is not None:
+                # Restore the stored state, stamped with this activation's time
+                meme.metadata = snapshot["metadata"]
+                context = snapshot["context"]
+                emotional_state = snapshot["emotional_state"]
+                context["creation_time"] = emotional_state["timestamp"] = time.time_ns()
+            else:
+                # Process the meme
+                self.processor.process_meme_sync(meme)
+                
+                # Initialize context
+                context = self.context_manager.create_context(meme)
+                
+                # Initialize emotional state
+                emotional_state = self.emotion_engine.initialize_state(meme)
+                
+                if cache_key:
+                    self.activation_cache.store(cache_key, {
+                        "metadata": meme.metadata,
+                        "context": context,
+                        "emotional_state": emotional_state
+                    })
             
-            # Initialize emotional state
-            emotional_state = self.emotion_engine.initialize_state(meme)
+            meme.set_context(context)
             meme.set_emotional_state(emotional_state)
             
             # Register the active entity
             self.active_entities[meme.id] = meme
             
-            self.logger.info(f"Successfully activated meme entity: {meme.id}")
+            self.logger.info("Successfully activated meme entity: %s", meme.id)
             return True
             
-        except Exception as e:
-            self.logger.error(f"Failed to activate meme entity: {str(e)}")
+        except Exception:
+            self.logger.exception("Failed to activate meme entity: %s", meme.id)
             return False
 
+    async def activate_async(self, meme: MemeEntity) -> bool:
+        """
+        Activate a meme entity from async code without blocking the event loop.
+
+        Args:
+            meme: The meme entity to activate.
+
+        Returns:
+            bool: True if activation was successful, False otherwise.
+        """
+        return await asyncio.to_thread(self.activate, meme)
+
     def interact(self, meme_id: str, interaction: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process an interaction with a meme entity.
@@ -78,21 +125,70 @@ class MemOSEngine:
         Returns:
             Dict[str, Any]: The response from the meme entity.
         """
-        if meme_id not in self.active_entities:
-            raise ValueError(f"No active meme entity found with ID: {meme_id}")
+        return self.interact_batch([(meme_id, interaction)])[0]
 
-        meme = self.active_entities[meme_id]
-        
-        # Update context based on interaction
-        self.context_manager.update_context(meme, interaction)
-        
-        # Process emotional response
-        emotional_response = self.emotion_engine.process_interaction(meme, interaction)
+    def interact_batch(self, pairs: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Process several interactions, updating emotional states in bulk.
+
+        Args:
+            pairs: (meme_id, interaction) tuples in the order they occurred.
+
+        Returns:
+            List[Dict[str, Any]]: Responses in the order of pairs.
+        """
+        # Resolve every entity up front so a bad ID fails the whole batch
+        memes = [self._get_active(meme_id) for meme_id, _ in pairs]
+        interactions = [interaction for _, interaction in pairs]
         
-        # Generate meme response
-        response = self.processor.generate_response(meme, interaction, emotional_response)
+        # Errors from the components are logged once, here
+        try:
+            # Update context based on interactions
+            for meme, interaction in zip(memes, interactions):
+                self.context_manager.update_context(meme, interaction)
+                meme.record_interaction()
+            
+            # Process emotional responses
+            emotional_responses = self.emotion_engine.process_batch(memes, interactions)
+            
+            # Generate meme responses
+            return [
+                self.processor.generate_response(meme, interaction, emotional_response)
+                for meme, interaction, emotional_response
+                in zip(memes, interactions, emotional_responses)
+            ]
+        except Exception:
+            self.logger.exception("Interaction failed for %s", [meme.id for meme in memes])
+            raise
+
+    def interact_stream(self, meme_id: str, interaction: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Process an interaction, yielding each stage's result as soon as it is ready.
+
+        Args:
+            meme_id: The ID of the meme to interact with.
+            interaction: Dictionary containing interaction details.
+
+        Yields:
+            Dict[str, Any]: Stage events with ``event`` and ``data`` keys.
+        """
+        meme = self._get_active(meme_id)
         
-        return response
+        try:
+            # Update context based on interaction
+            self.context_manager.update_context(meme, interaction)
+            meme.record_interaction()
+            
+            # Process emotional response
+            emotional_response = self.emotion_engine.process_interaction(meme, interaction)
+            yield {"event": "emotion", "data": emotional_response}
+            
+            # Generate meme response
+            response = self.processor.generate_response(meme, interaction, emotional_response)
+            yield {"event": "response", "data": response}
+        except Exception:
+            self.logger.exception("Interaction failed for %s", meme_id)
+            raise
 
     def deactivate(self, meme_id: str) -> bool:
         """
@@ -104,9 +200,9 @@ class MemOSEngine:
         Returns:
             bool: True if deactivation was successful, False otherwise.
         """
-        if meme_id in self.active_entities:
+        meme = self.active_entities.get(meme_id)
+        if meme is not None:
             try:
-                meme = self.active_entities[meme_id]
                 # Cleanup resources
                 self.context_manager.cleanup(meme)
                 self.emotion_engine.cleanup(meme)
@@ -114,10 +210,10 @@ class MemOSEngine:
                 # Remove from active entities
                 del self.active_entities[meme_id]
                 
-                self.logger.info(f"Successfully deactivated meme entity: {meme_id}")
+                self.logger.info("Successfully deactivated meme entity: %s", meme_id)
                 return True
-            except Exception as e:
-                self.logger.error(f"Error deactivating meme entity: {str(e)}")
+            except Exception:
+                self.logger.exception("Error deactivating meme entity: %s", meme_id)
                 return False
         return False
 
@@ -130,6 +226,18 @@ class MemOSEngine:
         """
         return list(self.active_entities.keys())
 
+    def is_active(self, meme_id: str) -> bool:
+        """
+        Check whether a meme entity is active.
+
+        Args:
+            meme_id: The ID of the meme entity.
+
+        Returns:
+            bool: True if the entity is active, False otherwise.
+        """
+        return meme_id in self.active_entities
+
     def get_entity_status(self, meme_id: str) -> Dict[str, Any]:
         """
         Get the current status of a meme entity.
@@ -140,15 +248,43 @@ class MemOSEngine:
         Returns:
             Dict[str, Any]: Dictionary containing entity status information.
         """
-        if meme_id not in self.active_entities:
+        return self._build_status(self._get_active(meme_id))
+
+    def get_entity_statuses(self, meme_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get the current status of several meme entities in one call.
+
+        Args:
+            meme_ids: The IDs of the meme entities.
+
+        Returns:
+            List[Dict[str, Any]]: Status dictionaries in the order of meme_ids.
+        """
+        memes = [self._get_active(meme_id) for meme_id in meme_ids]
+        return [self._build_status(meme) for meme in memes]
+
+    def _get_active(self, meme_id: str) -> MemeEntity:
+        """Look up an active meme entity, raising ValueError if it is not active."""
+        meme = self.active_entities.get(meme_id)
+        if meme is None:
             raise ValueError(f"No active meme entity found with ID: {meme_id}")
+        return meme
 
-        meme = self.active_entities[meme_id]
+    def _build_status(self, meme: MemeEntity) -> Dict[str, Any]:
+        """
+        Build the status dictionary for an active meme entity.
+
+        The fields shared with the API's EntityStatus model use the same
+        names and serializable types, so the dict can be returned directly.
+        """
         return {
             "id": meme.id,
             "status": "active",
-            "context": meme.get_context(),
-            "emotional_state": meme.get_emotional_state(),
-            "creation_time": meme.creation_time,
-            "last_interaction": meme.last_interaction_time
+            "context": self.context_manager.describe_context(meme.get_context()),
+            "emotional_state": self.emotion_engine.describe_state(meme.get_emotional_state()),
+            "creation_time": meme.creation_time.isoformat(),
+            "last_interaction_time": (
+                meme.last_interaction_time.isoformat() if meme.last_interaction_time else None
+            ),
+            "metadata": meme.metadata
         } 
\ No newline at end of file
@@ -2,6 +2,7 @@
 MemeProcessor module for handling meme processing operations.
 """
 
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from memos.entities import MemeEntity
 from memos.utils import logger
@@ -23,6 +24,21 @@ class MemeProcessor:
         self.logger = logger.get_logger(__name__)
 
     async def process_meme(self, meme: MemeEntity) -> MemeEntity:
+        """
+        Process a meme entity from async code.
+        
+        Processing does no I/O, so this runs the synchronous pipeline
+        directly rather than awaiting each step.
+        
+        Args:
+            meme: The meme entity to process
+            
+        Returns:
+            Processed meme entity
+        """
+        return self.process_meme_sync(meme)
+
+    def process_meme_sync(self, meme: MemeEntity) -> MemeEntity:
         """
         Process a meme entity applying transformations and analysis.
         
@@ -34,49 +50,75 @@ class MemeProcessor:
         """
         try:
             # Log processing start
-            self.logger.info(f"Processing meme: {meme.id}")
+            self.logger.info("Processing meme: %s", meme.id)
             
             # Apply transformations
-            processed_meme = await self._apply_transformations(meme)
+            processed_meme = self._apply_transformations(meme)
             
             # Analyze content
-            await self._analyze_content(processed_meme)
+            self._analyze_content(processed_meme)
             
             # Update metadata
-            processed_meme = await self._update_metadata(processed_meme)
+            processed_meme = self._update_metadata(processed_meme)
             
-            self.logger.info(f"Meme processing completed: {meme.id}")
+            self.logger.info("Meme processing completed: %s", meme.id)
             return processed_meme
             
-        except Exception as e:
-            self.logger.error(f"Error processing meme {meme.id}: {str(e)}")
+        except Exception:
+            self.logger.exception("Error processing meme %s", meme.id)
             raise
 
-    async def _apply_transformations(self, meme: MemeEntity) -> MemeEntity:
+    def generate_response(
+        self,
+        meme: MemeEntity,
+        interaction: Dict[str, Any],
+        emotional_response: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Generate the meme's response to an interaction.
+        
+        Args:
+            meme: The meme entity
+            interaction: Interaction data
+            emotional_response: Emotional response from the emotion engine
+            
+        Returns:
+            Response dictionary
+        """
+        return {
+            'entity_id': meme.id,
+            'interaction_type': interaction.get('type'),
+            'response_type': emotional_response.get('response_type', 'neutral'),
+            'content': self._generate_content(meme, interaction, emotional_response),
+            'emotional_response': emotional_response,
+            'timestamp': emotional_response.get('timestamp')
+        }
+
+    def _apply_transformations(self, meme: MemeEntity) -> MemeEntity:
         """Apply visual and content transformations to the meme."""
         # Apply visual transformations
-        meme = await self._apply_visual_transformations(meme)
+        meme = self._apply_visual_transformations(meme)
         
         # Apply content transformations
-        meme = await self._apply_content_transformations(meme)
+        meme = self._apply_content_transformations(meme)
         
         return meme
 
-    async def _analyze_content(self, meme: MemeEntity) -> None:
+    def _analyze_content(self, meme: MemeEntity) -> None:
         """Analyze meme content for various attributes."""
         # Analyze sentiment
-        sentiment = await self._analyze_sentiment(meme)
+        sentiment = self._analyze_sentiment(meme)
         meme.metadata['sentiment'] = sentiment
         
         # Analyze context
-        context = await self._analyze_context(meme)
+        context = self._analyze_context(meme)
         meme.metadata['context'] = context
         
         # Analyze engagement potential
-        engagement = await self._analyze_engagement_potential(meme)
+        engagement = self._analyze_engagement_potential(meme)
         meme.metadata['engagement_potential'] = engagement
 
-    async def _update_metadata(self, meme: MemeEntity) -> MemeEntity:
+    def _update_metadata(self, meme: MemeEntity) -> MemeEntity:
         """Update meme metadata with processing results."""
         meme.metadata.update({
             'processed': True,
@@ -85,35 +127,44 @@ class MemeProcessor:
         })
         return meme
 
-    async def _apply_visual_transformations(self, meme: MemeEntity) -> MemeEntity:
+    def _apply_visual_transformations(self, meme: MemeEntity) -> MemeEntity:
         """Apply visual transformations to the meme."""
         # Implement visual transformations
         return meme
 
-    async def _apply_content_transformations(self, meme: MemeEntity) -> MemeEntity:
+    def _apply_content_transformations(self, meme: MemeEntity) -> MemeEntity:
         """Apply content transformations to the meme."""
         # Implement content transformations
         return meme
 
-    async def _analyze_sentiment(self, meme: MemeEntity) -> Dict[str, float]:
+    def _analyze_sentiment(self, meme: MemeEntity) -> Dict[str, float]:
         """Analyze meme sentiment."""
         # Implement sentiment analysis
         return {'positive': 0.8, 'negative': 0.2}
 
-    async def _analyze_context(self, meme: MemeEntity) -> Dict[str, Any]:
+    def _analyze_context(self, meme: MemeEntity) -> Dict[str, Any]:
         """Analyze meme context."""
         # Implement context analysis
         return {'relevance': 0.9, 'appropriateness': 0.95}
 
-    async def _analyze_engagement_potential(self, meme: MemeEntity) -> float:
+    def _analyze_engagement_potential(self, meme: MemeEntity) -> float:
         """Analyze potential engagement."""
         # Implement engagement analysis
         return 0.85
 
+    def _generate_content(
+        self,
+        meme: MemeEntity,
+        interaction: Dict[str, Any],
+        emotional_response: Dict[str, Any]
+    ) -> str:
+        """Generate response content."""
+        # Implement response content generation
+        return ''
+
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        return datetime.now(timezone.utc).isoformat()
 
     def _get_version(self) -> str:
         """Get processor version."""
@@ -3,5 +3,6 @@
 from .meme_entity import MemeEntity
 from .context import Context
 from .emotional_state import EmotionalState
+from .collection import EntityCollection
 
-__all__ = ["MemeEntity", "Context", "EmotionalState"] 
\ No newline at end of file
+__all__ = ["MemeEntity", "Context", "EmotionalState", "EntityCollection"] 
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Compiled mood computation for batches of emotional states.
+"""
+
+from numba import njit
+import numpy as np
+
+@njit(cache=True, fastmath=True)
+def update_mood_batch(emotions: np.ndarray) -> np.ndarray:
+    """
+    Compute the mood for each row of an emotion matrix.
+
+    Args:
+        emotions: (N, 8) float32 array in EmotionalState.CORE_EMOTIONS order.
+
+    Returns:
+        np.ndarray: (N,) float32 array of moods clamped to [-1.0, 1.0].
+    """
+    n = emotions.shape[0]
+    moods = np.empty(n, np.float32)
+    for i in range(n):
+        # joy, trust, anticipation against sadness, anger, fear, disgust
+        positive = (emotions[i, 0] + emotions[i, 6] + emotions[i, 7]) / 3.0
+        negative = (emotions[i, 1] + emotions[i, 2] + emotions[i, 3] + emotions[i, 5]) / 4.0
+        mood = positive - negative
+        if mood < -1.0:
+            mood = -1.0
+        elif mood > 1.0:
+            mood = 1.0
+        moods[i] = mood
+    return moods
\ No newline at end of file
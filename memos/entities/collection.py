@@ -0,0 +1,138 @@
+"""
+EntityCollection - Columnar view over many meme entities for batch operations.
+"""
+
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from memos.entities.emotional_state import EmotionalState
+from memos.entities.meme_entity import MemeEntity
+
+class EntityCollection:
+    """
+    Stores the numeric state of many meme entities in parallel arrays.
+
+    Each MemeEntity keeps its state in its own objects, so analytics over
+    a large set of entities touch one object at a time. The collection
+    copies that state into one row per entity so NumPy and Numba kernels
+    can process every entity in a single pass. Results are written back
+    with ``to_entities``.
+
+    Both EmotionalState objects and the state dicts kept by MemOSEngine
+    (whose ``current_emotions`` vector uses the same emotion order) are
+    supported.
+    """
+
+    def __init__(self):
+        """Initialize an empty EntityCollection."""
+        self.ids: List[str] = []
+        self.creation_time = np.empty(0, dtype=np.int64)  # ns since the epoch
+        self.emotions = np.empty((0, len(EmotionalState.CORE_EMOTIONS)), dtype=np.float32)
+        self.mood = np.empty(0, dtype=np.float32)
+        self._rows: Dict[str, int] = {}
+        self._entities: List[MemeEntity] = []
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[MemeEntity]) -> 'EntityCollection':
+        """
+        Build a collection from meme entities.
+
+        Entities without an emotional state get a neutral row. Engine state
+        dicts carry no mood, so theirs is derived from their emotions.
+
+        Args:
+            entities: The meme entities to include.
+
+        Returns:
+            EntityCollection: A collection with one row per entity.
+        """
+        collection = cls()
+        collection._entities = list(entities)
+        n = len(collection._entities)
+
+        collection.ids = [entity.id for entity in collection._entities]
+        collection._rows = {entity_id: i for i, entity_id in enumerate(collection.ids)}
+        collection.creation_time = np.fromiter(
+            (int(entity.creation_time.timestamp() * 1_000_000_000) for entity in collection._entities),
+            dtype=np.int64, count=n
+        )
+        collection.emotions = np.tile(EmotionalState._DEFAULT_EMOTIONS, (n, 1))
+        collection.mood = np.zeros(n, dtype=np.float32)
+
+        # Copy emotional state into the row matrix
+        derived = []
+        for i, entity in enumerate(collection._entities):
+            state = entity.get_emotional_state()
+            if isinstance(state, EmotionalState):
+                collection.emotions[i] = state._emotions
+                collection.mood[i] = state._mood
+            elif isinstance(state, dict) and 'current_emotions' in state:
+                collection.emotions[i] = state['current_emotions']
+                derived.append(i)
+            elif state:
+                raise TypeError(
+                    f"Unsupported emotional state for entity {entity.id}: {type(state).__name__}"
+                )
+
+        if derived:
+            collection.mood[derived] = EmotionalState.update_mood_batch(collection.emotions[derived])
+
+        return collection
+
+    def row(self, entity_id: str) -> int:
+        """
+        Get the row index of an entity.
+
+        Args:
+            entity_id: ID of the entity.
+
+        Returns:
+            int: Row index into the collection arrays.
+        """
+        if entity_id not in self._rows:
+            raise ValueError(f"Entity {entity_id} not in collection")
+        return self._rows[entity_id]
+
+    def update_mood_all(self) -> np.ndarray:
+        """
+        Recompute the mood of every entity from its emotions.
+
+        Returns:
+            np.ndarray: (N,) float32 array of updated moods.
+        """
+        self.mood = EmotionalState.update_mood_batch(self.emotions)
+        return self.mood
+
+    def to_entities(self) -> List[MemeEntity]:
+        """
+        Write the collection state back to its entities.
+
+        Entities that had no emotional state are given one. Engine state
+        dicts get their ``current_emotions`` replaced. History is not
+        recorded for the write-back.
+
+        Returns:
+            List[MemeEntity]: The entities, in row order.
+        """
+        for i, entity in enumerate(self._entities):
+            state = entity.get_emotional_state()
+            if isinstance(state, dict) and 'current_emotions' in state:
+                # Engine states may share vectors with their previous state
+                state['current_emotions'] = self.emotions[i].copy()
+                continue
+            if not isinstance(state, EmotionalState):
+                state = EmotionalState()
+                entity.set_emotional_state(state)
+
+            state._emotions[:] = self.emotions[i]
+            state._mood = float(self.mood[i])
+            state._update_timestamp()
+
+        return self._entities
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._rows
\ No newline at end of file
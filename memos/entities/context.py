@@ -2,23 +2,44 @@
 Context - Represents the contextual state and awareness of a meme entity.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, Any, List, Optional
+from datetime import datetime, timezone
+import time
+
+from memos.utils.timestamps import to_isoformat
 
 class Context:
     """
     Represents the contextual awareness and state of a meme entity.
     """
 
-    def __init__(self):
-        """Initialize a new Context instance."""
-        self.creation_time = datetime.now()
-        self.last_update = self.creation_time
+    __slots__ = (
+        'creation_time_ns', 'last_update_ns', '_creation_time_iso', '_last_update_iso',
+        '_environment', '_user_context', '_interaction_history', '_memory', '_preferences'
+    )
+
+    def __init__(self, history_max: int = 1024):
+        """
+        Initialize a new Context instance.
+
+        Args:
+            history_max: Maximum number of interactions kept in history;
+                the oldest are dropped once it is full.
+        """
+        # Timestamps are kept as epoch nanoseconds and formatted on output
+        self.creation_time_ns = time.time_ns()
+        self.last_update_ns = self.creation_time_ns
+        
+        # ISO strings for serialization; last_update's is rebuilt lazily
+        self._creation_time_iso = to_isoformat(self.creation_time_ns)
+        self._last_update_iso: Optional[str] = self._creation_time_iso
         
         # Core context attributes
         self._environment: Dict[str, Any] = {}
         self._user_context: Dict[str, Any] = {}
-        self._interaction_history: List[Dict[str, Any]] = []
+        self._interaction_history: Deque[Dict[str, Any]] = deque(maxlen=history_max)
         self._memory: Dict[str, Any] = {}
         self._preferences: Dict[str, Any] = {}
         
@@ -49,7 +70,7 @@ class Context:
         Args:
             interaction: Dictionary containing interaction details.
         """
-        interaction["timestamp"] = datetime.now()
+        interaction["timestamp"] = time.time_ns()
         self._interaction_history.append(interaction)
         self._update_timestamp()
 
@@ -64,8 +85,10 @@ class Context:
             List[Dict[str, Any]]: List of recent interactions.
         """
         if limit is None:
-            return self._interaction_history
-        return self._interaction_history[-limit:]
+            return list(self._interaction_history)
+        recent = list(islice(reversed(self._interaction_history), limit))
+        recent.reverse()
+        return recent
 
     def update_memory(self, key: str, value: Any) -> None:
         """
@@ -113,9 +136,20 @@ class Context:
         """
         return self._preferences.get(key)
 
+    @property
+    def creation_time(self) -> datetime:
+        """Creation time as a UTC datetime."""
+        return datetime.fromtimestamp(self.creation_time_ns / 1e9, timezone.utc)
+
+    @property
+    def last_update(self) -> datetime:
+        """Last modification time as a UTC datetime."""
+        return datetime.fromtimestamp(self.last_update_ns / 1e9, timezone.utc)
+
     def _update_timestamp(self) -> None:
         """Update the last modification timestamp."""
-        self.last_update = datetime.now()
+        self.last_update_ns = time.time_ns()
+        self._last_update_iso = None
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -124,12 +158,17 @@ class Context:
         Returns:
             Dict[str, Any]: Dictionary representation of the context.
         """
+        if self._last_update_iso is None:
+            self._last_update_iso = to_isoformat(self.last_update_ns)
         return {
-            "creation_time": self.creation_time.isoformat(),
-            "last_update": self.last_update.isoformat(),
+            "creation_time": self._creation_time_iso,
+            "last_update": self._last_update_iso,
             "environment": self._environment,
             "user_context": self._user_context,
-            "interaction_history": self._interaction_history,
+            "interaction_history": [
+                {**interaction, "timestamp": to_isoformat(interaction["timestamp"])}
+                for interaction in self._interaction_history
+            ],
             "memory": self._memory,
             "preferences": self._preferences
         }
@@ -2,15 +2,37 @@
 EmotionalState - Represents the emotional state and awareness of a meme entity.
 """
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from collections import deque
+from itertools import islice
+from typing import BinaryIO, Deque, Dict, Any, Iterator, List, NamedTuple, Optional
+from datetime import datetime, timezone
 import numpy as np
+import orjson
+
+from memos.entities._mood_kernel import update_mood_batch
+from memos.utils.timestamps import utc_now
+
+class EmotionSnapshot(NamedTuple):
+    """Compact record of an emotional state at one point in time."""
+    ts: float  # Seconds since the epoch
+    emotions: np.ndarray  # Copy of the emotion vector
+    mood: float
+
+def _clamp(x: float, lo: float, hi: float) -> float:
+    """Clamp a scalar to [lo, hi]; NaN is passed through like np.clip."""
+    return lo if x < lo else hi if x > hi else x
 
 class EmotionalState:
     """
     Represents the emotional state and awareness of a meme entity.
     """
 
+    __slots__ = (
+        'creation_time', 'last_update', '_emotions', '_mood',
+        '_emotional_history', '_history_capacity',
+        '_personality_traits'
+    )
+
     # Define core emotions and their default intensities
     CORE_EMOTIONS = {
         "joy": 0.0,
@@ -23,15 +45,32 @@ class EmotionalState:
         "anticipation": 0.0
     }
 
-    def __init__(self):
-        """Initialize a new EmotionalState instance."""
-        self.creation_time = datetime.now()
+    # Emotions are stored as a float32 vector in CORE_EMOTIONS order
+    _EMOTION_NAMES = tuple(CORE_EMOTIONS)
+    CORE_INDEX = {emotion: i for i, emotion in enumerate(_EMOTION_NAMES)}
+    _POS_IDX = np.array([0, 6, 7])  # joy, trust, anticipation
+    _NEG_IDX = np.array([1, 2, 3, 5])  # sadness, anger, fear, disgust
+    # Default intensities, built once and copied into each instance
+    _DEFAULT_EMOTIONS = np.array(tuple(CORE_EMOTIONS.values()), dtype=np.float32)
+    _DEFAULT_EMOTIONS.flags.writeable = False
+
+    def __init__(self, history_capacity: int = 1024):
+        """
+        Initialize a new EmotionalState instance.
+
+        Args:
+            history_capacity: Maximum number of history records kept; the
+                oldest are dropped once it is full.
+        """
+        self.creation_time = utc_now()
         self.last_update = self.creation_time
         
         # Core emotional attributes
-        self._emotions = self.CORE_EMOTIONS.copy()
+        self._emotions = self._DEFAULT_EMOTIONS.copy()
         self._mood = 0.0  # Range: -1.0 to 1.0
-        self._emotional_history: List[Dict[str, Any]] = []
+        # History is allocated on the first recorded change
+        self._emotional_history: Optional[Deque[EmotionSnapshot]] = None
+        self._history_capacity = history_capacity
         self._personality_traits: Dict[str, float] = {}
         
     def update_emotion(self, emotion: str, intensity: float) -> None:
@@ -42,14 +81,20 @@ class EmotionalState:
             emotion: Name of the emotion.
             intensity: New intensity value (0.0 to 1.0).
         """
-        if emotion not in self._emotions:
+        index = self.CORE_INDEX.get(emotion)
+        if index is None:
             raise ValueError(f"Unknown emotion: {emotion}")
         
-        intensity = np.clip(intensity, 0.0, 1.0)
-        self._emotions[emotion] = intensity
+        # Compare at storage precision; unchanged values are not recorded
+        intensity = np.float32(_clamp(intensity, 0.0, 1.0))
+        if intensity == self._emotions[index]:
+            return
+        
+        now = utc_now()
+        self._emotions[index] = intensity
         self._update_mood()
-        self._record_emotional_state()
-        self._update_timestamp()
+        self._record_emotional_state(now)
+        self._update_timestamp(now)
 
     def get_emotion(self, emotion: str) -> float:
         """
@@ -61,9 +106,10 @@ class EmotionalState:
         Returns:
             float: Current intensity of the emotion (0.0 to 1.0).
         """
-        if emotion not in self._emotions:
+        index = self.CORE_INDEX.get(emotion)
+        if index is None:
             raise ValueError(f"Unknown emotion: {emotion}")
-        return self._emotions[emotion]
+        return float(self._emotions[index])
 
     def get_dominant_emotion(self) -> tuple[str, float]:
         """
@@ -72,7 +118,31 @@ class EmotionalState:
         Returns:
             tuple[str, float]: Tuple of (emotion_name, intensity).
         """
-        return max(self._emotions.items(), key=lambda x: x[1])
+        index = int(self._emotions.argmax())
+        return self._EMOTION_NAMES[index], float(self._emotions[index])
+
+    @property
+    def emotions(self) -> Dict[str, float]:
+        """
+        Get all emotion intensities by name.
+
+        Returns:
+            Dict[str, float]: Mapping of emotion name to intensity.
+        """
+        return dict(zip(self._EMOTION_NAMES, self._emotions.tolist()))
+
+    @classmethod
+    def update_mood_batch(cls, emotions: np.ndarray) -> np.ndarray:
+        """
+        Compute moods for many emotion vectors at once.
+
+        Args:
+            emotions: (N, 8) array of emotions in CORE_EMOTIONS order.
+
+        Returns:
+            np.ndarray: (N,) float32 array of moods (-1.0 to 1.0).
+        """
+        return update_mood_batch(np.ascontiguousarray(emotions, dtype=np.float32))
 
     def set_mood(self, mood: float) -> None:
         """
@@ -81,9 +151,14 @@ class EmotionalState:
         Args:
             mood: Mood value (-1.0 to 1.0).
         """
-        self._mood = np.clip(mood, -1.0, 1.0)
-        self._record_emotional_state()
-        self._update_timestamp()
+        mood = _clamp(mood, -1.0, 1.0)
+        if mood == self._mood:
+            return
+        
+        now = utc_now()
+        self._mood = mood
+        self._record_emotional_state(now)
+        self._update_timestamp(now)
 
     def get_mood(self) -> float:
         """
@@ -102,7 +177,11 @@ class EmotionalState:
             trait: Name of the personality trait.
             value: Trait value (0.0 to 1.0).
         """
-        self._personality_traits[trait] = np.clip(value, 0.0, 1.0)
+        value = _clamp(value, 0.0, 1.0)
+        if self._personality_traits.get(trait) == value:
+            return
+        
+        self._personality_traits[trait] = value
         self._update_timestamp()
 
     def get_personality_trait(self, trait: str) -> Optional[float]:
@@ -127,33 +206,58 @@ class EmotionalState:
         Returns:
             List[Dict[str, Any]]: List of emotional state records.
         """
-        if limit is None:
-            return self._emotional_history
-        return self._emotional_history[-limit:]
+        history = self._emotional_history
+        if history is None:
+            return []
+        if limit is not None:
+            history = islice(history, max(0, len(history) - limit), None)
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(snapshot.ts, timezone.utc),
+                "emotions": dict(zip(self._EMOTION_NAMES, snapshot.emotions.tolist())),
+                "mood": snapshot.mood
+            }
+            for snapshot in history
+        ]
 
     def _update_mood(self) -> None:
         """Update the mood based on current emotions."""
         # Simple mood calculation based on weighted average of emotions
-        positive_emotions = ["joy", "trust", "anticipation"]
-        negative_emotions = ["sadness", "anger", "fear", "disgust"]
-        
-        positive_value = sum(self._emotions[e] for e in positive_emotions) / len(positive_emotions)
-        negative_value = sum(self._emotions[e] for e in negative_emotions) / len(negative_emotions)
+        positive_value = self._emotions[self._POS_IDX].mean()
+        negative_value = self._emotions[self._NEG_IDX].mean()
         
-        self._mood = np.clip(positive_value - negative_value, -1.0, 1.0)
+        self._mood = _clamp(float(positive_value - negative_value), -1.0, 1.0)
 
-    def _record_emotional_state(self) -> None:
+    def _record_emotional_state(self, now: datetime) -> None:
         """Record the current emotional state in history."""
-        state = {
-            "timestamp": datetime.now(),
-            "emotions": self._emotions.copy(),
-            "mood": self._mood
-        }
-        self._emotional_history.append(state)
+        if self._emotional_history is None:
+            self._emotional_history = deque(maxlen=self._history_capacity)
+        
+        # Emotions are stored as a vector copy and expanded only when read
+        self._emotional_history.append(
+            EmotionSnapshot(now.timestamp(), self._emotions.copy(), self._mood)
+        )
+
+    def _update_timestamp(self, now: Optional[datetime] = None) -> None:
+        """Update the last modification timestamp, reusing a captured time if given."""
+        self.last_update = now or utc_now()
+
+    def iter_history_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the emotional history as serializable records.
 
-    def _update_timestamp(self) -> None:
-        """Update the last modification timestamp."""
-        self.last_update = datetime.now()
+        Records are built one at a time, so callers streaming the history
+        never hold the whole converted list in memory.
+
+        Yields:
+            Dict[str, Any]: Emotional state record, oldest first.
+        """
+        for snapshot in self._emotional_history or ():
+            yield {
+                "timestamp": datetime.fromtimestamp(snapshot.ts, timezone.utc).isoformat(),
+                "emotions": dict(zip(self._EMOTION_NAMES, snapshot.emotions.tolist())),
+                "mood": snapshot.mood
+            }
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -162,20 +266,48 @@ class EmotionalState:
         Returns:
             Dict[str, Any]: Dictionary representation of the emotional state.
         """
+        state = self._summary_dict()
+        history = self._emotional_history or ()
+        
+        # Convert every emotion vector to Python floats with a single call
+        rows = np.stack([snapshot.emotions for snapshot in history]).tolist() if history else []
+        state["emotional_history"] = [
+            {
+                "timestamp": datetime.fromtimestamp(snapshot.ts, timezone.utc).isoformat(),
+                "emotions": dict(zip(self._EMOTION_NAMES, row)),
+                "mood": snapshot.mood
+            }
+            for snapshot, row in zip(history, rows)
+        ]
+        return state
+
+    def dump_json(self, fp: BinaryIO) -> None:
+        """
+        Write the emotional state as JSON, streaming the history.
+
+        The output matches ``to_dict``, but history records are encoded and
+        written one at a time instead of being collected first.
+
+        Args:
+            fp: Binary file object to write to.
+        """
+        # Open the summary object and append the history array to it
+        fp.write(orjson.dumps(self._summary_dict())[:-1])
+        fp.write(b',"emotional_history":[')
+        for i, record in enumerate(self.iter_history_records()):
+            if i:
+                fp.write(b',')
+            fp.write(orjson.dumps(record))
+        fp.write(b']}')
+
+    def _summary_dict(self) -> Dict[str, Any]:
+        """Build the dictionary representation without the history."""
         return {
             "creation_time": self.creation_time.isoformat(),
             "last_update": self.last_update.isoformat(),
-            "emotions": self._emotions,
+            "emotions": self.emotions,
             "mood": self._mood,
-            "personality_traits": self._personality_traits,
-            "emotional_history": [
-                {
-                    "timestamp": state["timestamp"].isoformat(),
-                    "emotions": state["emotions"],
-                    "mood": state["mood"]
-                }
-                for state in self._emotional_history
-            ]
+            "personality_traits": self._personality_traits
         }
 
     def __repr__(self) -> str:
@@ -2,24 +2,55 @@
 MemeEntity - The core entity class representing an interactive meme in the MemOS environment.
 """
 
-import uuid
+import hashlib
+import secrets
+import sys
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
 import numpy as np
-from PIL import Image
 
 from memos.entities.context import Context
 from memos.entities.emotional_state import EmotionalState
-from memos.utils.image_processing import load_image, preprocess_image
+from memos.utils.timestamps import utc_now
+from memos.utils.image_processing import load_image, decode_image, preprocess_image
 from memos.utils.logger import get_logger
 
+logger = get_logger(__name__)
+
+def _intern_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy metadata, interning string keys and values.
+
+    Memes from the same template family repeat the same tags and sources,
+    so interning lets every entity share a single copy of each string.
+    Only plain lists and tuples of strings are rebuilt; any other value is
+    kept as is.
+    """
+    interned = {}
+    for key, value in metadata.items():
+        if isinstance(key, str):
+            key = sys.intern(key)
+        if isinstance(value, str):
+            value = sys.intern(value)
+        elif type(value) in (list, tuple) and all(isinstance(v, str) for v in value):
+            # Subclasses such as namedtuples can't be rebuilt from an iterable
+            value = type(value)(sys.intern(v) for v in value)
+        interned[key] = value
+    return interned
+
 class MemeEntity:
     """
     Represents a meme as an interactive entity within the MemOS environment.
     """
 
+    __slots__ = (
+        'id', 'image_path', '_image_data', 'metadata',
+        'creation_time', 'last_interaction_time',
+        '_context', '_emotional_state', '_features', '_fingerprint'
+    )
+
     def __init__(self, 
                  image_path: Optional[str] = None, 
                  image_data: Optional[np.ndarray] = None,
@@ -35,26 +66,25 @@ class MemeEntity:
         if not image_path and image_data is None:
             raise ValueError("Either image_path or image_data must be provided")
 
-        self.id = str(uuid.uuid4())
-        self.logger = get_logger(__name__)
+        # 128 random bits, URL-safe without the cost of building a UUID
+        self.id = secrets.token_urlsafe(16)
         
-        # Image data
+        # Image data; an image path takes precedence and is loaded on first use
         self.image_path = image_path
-        self.image_data = image_data
-        if image_path:
-            self.image_data = load_image(image_path)
+        self._image_data = None if image_path else image_data
         
         # Metadata
-        self.metadata = metadata or {}
-        self.creation_time = datetime.now()
+        self.metadata = _intern_metadata(metadata) if metadata else {}
+        self.creation_time = utc_now()
         self.last_interaction_time: Optional[datetime] = None
         
         # State
         self._context: Optional[Context] = None
         self._emotional_state: Optional[EmotionalState] = None
         self._features: Dict[str, Any] = {}
+        self._fingerprint: Optional[bytes] = None
         
-        self.logger.info(f"Created new MemeEntity with ID: {self.id}")
+        logger.info("Created new MemeEntity with ID: %s", self.id)
 
     @classmethod
     def from_image(cls, image_path: str) -> 'MemeEntity':
@@ -69,6 +99,20 @@ class MemeEntity:
         """
         return cls(image_path=image_path)
 
+    @classmethod
+    def from_bytes(cls, data: bytes, metadata: Optional[Dict[str, Any]] = None) -> 'MemeEntity':
+        """
+        Create a MemeEntity from encoded image bytes.
+
+        Args:
+            data: Encoded image data (e.g. the contents of a PNG or JPEG file).
+            metadata: Optional metadata about the meme.
+
+        Returns:
+            MemeEntity: A new meme entity instance.
+        """
+        return cls(image_data=decode_image(data), metadata=metadata)
+
     @classmethod
     def from_array(cls, image_data: np.ndarray, metadata: Optional[Dict[str, Any]] = None) -> 'MemeEntity':
         """
@@ -83,6 +127,23 @@ class MemeEntity:
         """
         return cls(image_data=image_data, metadata=metadata)
 
+    @property
+    def image_data(self) -> np.ndarray:
+        """
+        Get the meme image, loading it from image_path on first access.
+
+        Returns:
+            np.ndarray: The image data.
+        """
+        if self._image_data is None and self.image_path:
+            self._image_data = load_image(self.image_path)
+        return self._image_data
+
+    @image_data.setter
+    def image_data(self, image_data: np.ndarray) -> None:
+        self._image_data = image_data
+        self._fingerprint = None
+
     def set_context(self, context: Context) -> None:
         """
         Set the context for this meme entity.
@@ -91,12 +152,15 @@ class MemeEntity:
             context: The context object to set.
         """
         self._context = context
-        self.logger.debug(f"Updated context for entity {self.id}")
+        logger.debug("Updated context for entity %s", self.id)
 
     def get_context(self) -> Optional[Context]:
         """
         Get the current context of the meme entity.
 
+        The live context is returned, not a copy; callers update it in
+        place and do not need to set it back.
+
         Returns:
             Optional[Context]: The current context or None if not set.
         """
@@ -110,7 +174,7 @@ class MemeEntity:
             state: The emotional state to set.
         """
         self._emotional_state = state
-        self.logger.debug(f"Updated emotional state for entity {self.id}")
+        logger.debug("Updated emotional state for entity %s", self.id)
 
     def get_emotional_state(self) -> Optional[EmotionalState]:
         """
@@ -129,7 +193,7 @@ class MemeEntity:
             features: Dictionary of extracted features.
         """
         self._features.update(features)
-        self.logger.debug(f"Updated features for entity {self.id}")
+        logger.debug("Updated features for entity %s", self.id)
 
     def get_features(self) -> Dict[str, Any]:
         """
@@ -140,9 +204,26 @@ class MemeEntity:
         """
         return self._features
 
+    def get_fingerprint(self) -> bytes:
+        """
+        Get a digest identifying the meme's image content.
+
+        Entities created from identical images share the same fingerprint.
+
+        Returns:
+            bytes: 16-byte BLAKE2b digest of the image data and its shape.
+        """
+        if self._fingerprint is None:
+            image = np.ascontiguousarray(self.image_data)
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(f"{image.dtype}{image.shape}".encode())
+            digest.update(image)
+            self._fingerprint = digest.digest()
+        return self._fingerprint
+
     def record_interaction(self) -> None:
         """Record the timestamp of the latest interaction."""
-        self.last_interaction_time = datetime.now()
+        self.last_interaction_time = utc_now()
 
     def to_dict(self) -> Dict[str, Any]:
         """
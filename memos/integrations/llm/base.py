@@ -3,7 +3,7 @@ Base classes for LLM integrations in MemOS AI Framework.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, AsyncGenerator
 from dataclasses import dataclass
 from enum import Enum
 
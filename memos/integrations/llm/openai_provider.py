@@ -2,9 +2,11 @@
 OpenAI integration for MemOS AI Framework.
 """
 
+import asyncio
 import os
 from typing import Dict, Any, Optional, List, Union, AsyncGenerator
 import aiohttp
+import orjson
 import tiktoken
 
 from .base import (
@@ -17,10 +19,53 @@ from .base import (
     TokenLimitExceeded
 )
 
+def _dumps_json(obj: Any) -> str:
+    """Serialize request bodies with orjson."""
+    return orjson.dumps(obj).decode()
+
+# Plain dict lookup avoids the Enum .value descriptor per message
+_ROLE_STR = {role: role.value for role in ModelRole}
+
+def _format_messages(messages: List[ModelMessage]) -> List[Dict[str, Any]]:
+    """Convert messages to the OpenAI chat request format."""
+    formatted = []
+    for msg in messages:
+        message = {"role": _ROLE_STR[msg.role], "content": msg.content}
+        if msg.name:
+            message["name"] = msg.name
+        formatted.append(message)
+    return formatted
+
+def _make_chat_payload_builder(model: str):
+    """
+    Build a chat request payload builder specialized for one model.
+
+    The model name is bound once and optional fields are only added when
+    set, so requests never send ``max_tokens: null``. Every completion
+    request, streamed or not, builds its payload here.
+    """
+    def build(messages: List[Dict[str, Any]],
+              temperature: float,
+              max_tokens: Optional[int],
+              functions: Optional[List[Dict[str, Any]]],
+              extra: Dict[str, Any]) -> Dict[str, Any]:
+        payload = {"model": model, "messages": messages, "temperature": temperature}
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        if extra:
+            payload.update(extra)
+        if functions:
+            payload["functions"] = functions
+        return payload
+
+    return build
+
 class OpenAIProvider(LLMProvider):
     """OpenAI API provider implementation."""
 
     API_BASE = "https://api.openai.com/v1"
+    EMBED_BATCH = 256  # inputs per embeddings request
+    EMBED_CONCURRENCY = 8  # embeddings requests in flight
     AVAILABLE_MODELS = {
         # GPT-4 Models
         "gpt-4-turbo-preview": 128_000,  # GPT-4 Turbo
@@ -54,6 +99,39 @@ class OpenAIProvider(LLMProvider):
         self.organization = organization or os.getenv("OPENAI_ORG_ID")
         super().__init__(api_key=self.api_key, model=model, **kwargs)
 
+        # Created on first use so they bind to the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._embed_semaphore: Optional[asyncio.Semaphore] = None
+        self._encoding: Optional[tiktoken.Encoding] = None
+
+        # Builds the payload of every completion request
+        self._build_chat_payload = _make_chat_payload_builder(self.model)
+
+    async def __aenter__(self) -> "OpenAIProvider":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the HTTP session shared by all requests, reusing keep-alive connections."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=60),
+                json_serialize=_dumps_json
+            )
+            # Before Python 3.10 a semaphore binds to the loop current at
+            # creation, so it is recreated together with the session
+            self._embed_semaphore = asyncio.Semaphore(self.EMBED_CONCURRENCY)
+        return self._session
+
     def _validate_credentials(self) -> None:
         """Validate OpenAI credentials."""
         if not self.api_key:
@@ -82,35 +160,31 @@ class OpenAIProvider(LLMProvider):
         messages = [
             {"role": "user", "content": prompt}
         ]
+        if stop_sequences:
+            kwargs = {"stop": stop_sequences, **kwargs}
+        request_data = self._build_chat_payload(messages, temperature, max_tokens, None, kwargs)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.API_BASE}/chat/completions",
-                headers=self._get_headers(),
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "stop": stop_sequences,
-                    **kwargs
-                }
-            ) as response:
-                result = await response.json()
+        session = await self._get_session()
+        async with session.post(
+            f"{self.API_BASE}/chat/completions",
+            headers=self._get_headers(),
+            json=request_data
+        ) as response:
+            result = await response.json()
 
-                if "error" in result:
-                    raise Exception(result["error"]["message"])
+            if "error" in result:
+                raise Exception(result["error"]["message"])
 
-                return LLMResponse(
-                    content=result["choices"][0]["message"]["content"],
-                    raw_response=result,
-                    metadata={
-                        "finish_reason": result["choices"][0]["finish_reason"]
-                    },
-                    usage=result["usage"],
-                    model=self.model,
-                    provider="openai"
-                )
+            return LLMResponse(
+                content=result["choices"][0]["message"]["content"],
+                raw_response=result,
+                metadata={
+                    "finish_reason": result["choices"][0]["finish_reason"]
+                },
+                usage=result["usage"],
+                model=self.model,
+                provider="openai"
+            )
 
     async def chat(self,
                   messages: List[ModelMessage],
@@ -120,48 +194,32 @@ class OpenAIProvider(LLMProvider):
                   functions: Optional[List[Dict[str, Any]]] = None,
                   **kwargs) -> LLMResponse:
         """Chat completion using OpenAI API."""
-        formatted_messages = [
-            {
-                "role": msg.role.value,
-                "content": msg.content,
-                **({"name": msg.name} if msg.name else {})
-            }
-            for msg in messages
-        ]
-
-        request_data = {
-            "model": self.model,
-            "messages": formatted_messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            **kwargs
-        }
-
-        if functions:
-            request_data["functions"] = functions
+        request_data = self._build_chat_payload(
+            _format_messages(messages), temperature, max_tokens, functions, kwargs
+        )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.API_BASE}/chat/completions",
-                headers=self._get_headers(),
-                json=request_data
-            ) as response:
-                result = await response.json()
+        session = await self._get_session()
+        async with session.post(
+            f"{self.API_BASE}/chat/completions",
+            headers=self._get_headers(),
+            json=request_data
+        ) as response:
+            result = await response.json()
 
-                if "error" in result:
-                    raise Exception(result["error"]["message"])
+            if "error" in result:
+                raise Exception(result["error"]["message"])
 
-                return LLMResponse(
-                    content=result["choices"][0]["message"]["content"],
-                    raw_response=result,
-                    metadata={
-                        "finish_reason": result["choices"][0]["finish_reason"],
-                        "function_call": result["choices"][0]["message"].get("function_call")
-                    },
-                    usage=result["usage"],
-                    model=self.model,
-                    provider="openai"
-                )
+            return LLMResponse(
+                content=result["choices"][0]["message"]["content"],
+                raw_response=result,
+                metadata={
+                    "finish_reason": result["choices"][0]["finish_reason"],
+                    "function_call": result["choices"][0]["message"].get("function_call")
+                },
+                usage=result["usage"],
+                model=self.model,
+                provider="openai"
+            )
 
     async def embed(self,
                    text: Union[str, List[str]],
@@ -170,13 +228,28 @@ class OpenAIProvider(LLMProvider):
         if isinstance(text, str):
             text = [text]
 
-        async with aiohttp.ClientSession() as session:
+        # Large inputs are split into batches sent concurrently
+        batches = [
+            text[i:i + self.EMBED_BATCH]
+            for i in range(0, len(text), self.EMBED_BATCH)
+        ]
+        results = await asyncio.gather(
+            *(self._embed_batch(batch, **kwargs) for batch in batches)
+        )
+
+        embeddings = [embedding for result in results for embedding in result]
+        return embeddings[0] if len(embeddings) == 1 else embeddings
+
+    async def _embed_batch(self, texts: List[str], **kwargs) -> List[List[float]]:
+        """Send one embeddings request, limiting how many run at once."""
+        session = await self._get_session()
+        async with self._embed_semaphore:
             async with session.post(
                 f"{self.API_BASE}/embeddings",
                 headers=self._get_headers(),
                 json={
                     "model": "text-embedding-3-large",
-                    "input": text,
+                    "input": texts,
                     **kwargs
                 }
             ) as response:
@@ -185,17 +258,24 @@ class OpenAIProvider(LLMProvider):
                 if "error" in result:
                     raise Exception(result["error"]["message"])
 
-                embeddings = [data["embedding"] for data in result["data"]]
-                return embeddings[0] if len(embeddings) == 1 else embeddings
+                return [data["embedding"] for data in result["data"]]
 
     def get_token_count(self, text: str) -> int:
         """Get token count using tiktoken."""
-        try:
-            encoding = tiktoken.encoding_for_model(self.model)
-            return len(encoding.encode(text))
-        except KeyError:
-            encoding = tiktoken.get_encoding("cl100k_base")
-            return len(encoding.encode(text))
+        return len(self._get_encoding().encode(text))
+
+    def get_token_counts(self, texts: List[str]) -> List[int]:
+        """Get token counts for several texts, encoding them in parallel."""
+        return [len(tokens) for tokens in self._get_encoding().encode_batch(texts)]
+
+    def _get_encoding(self) -> tiktoken.Encoding:
+        """Get the tiktoken encoding for the model, looked up once."""
+        if self._encoding is None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                self._encoding = tiktoken.get_encoding("cl100k_base")
+        return self._encoding
 
     async def stream_generate(self,
                             prompt: str,
@@ -207,26 +287,18 @@ class OpenAIProvider(LLMProvider):
         messages = [
             {"role": "user", "content": prompt}
         ]
+        request_data = self._build_chat_payload(
+            messages, temperature, max_tokens, None, {"stream": True, **kwargs}
+        )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.API_BASE}/chat/completions",
-                headers=self._get_headers(),
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "stream": True,
-                    **kwargs
-                }
-            ) as response:
-                async for line in response.content:
-                    if line:
-                        chunk = line.decode().strip()
-                        if chunk.startswith("data: ") and chunk != "data: [DONE]":
-                            content = chunk[6:]
-                            yield content
+        session = await self._get_session()
+        async with session.post(
+            f"{self.API_BASE}/chat/completions",
+            headers=self._get_headers(),
+            json=request_data
+        ) as response:
+            async for delta in self._iter_stream_deltas(response):
+                yield delta
 
     async def stream_chat(self,
                          messages: List[ModelMessage],
@@ -235,34 +307,32 @@ class OpenAIProvider(LLMProvider):
                          temperature: float = 0.7,
                          **kwargs) -> AsyncGenerator[str, None]:
         """Stream chat completion from OpenAI API."""
-        formatted_messages = [
-            {
-                "role": msg.role.value,
-                "content": msg.content,
-                **({"name": msg.name} if msg.name else {})
-            }
-            for msg in messages
-        ]
+        request_data = self._build_chat_payload(
+            _format_messages(messages), temperature, max_tokens, None, {"stream": True, **kwargs}
+        )
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.API_BASE}/chat/completions",
-                headers=self._get_headers(),
-                json={
-                    "model": self.model,
-                    "messages": formatted_messages,
-                    "temperature": temperature,
-                    "max_tokens": max_tokens,
-                    "stream": True,
-                    **kwargs
-                }
-            ) as response:
-                async for line in response.content:
-                    if line:
-                        chunk = line.decode().strip()
-                        if chunk.startswith("data: ") and chunk != "data: [DONE]":
-                            content = chunk[6:]
-                            yield content
+        session = await self._get_session()
+        async with session.post(
+            f"{self.API_BASE}/chat/completions",
+            headers=self._get_headers(),
+            json=request_data
+        ) as response:
+            async for delta in self._iter_stream_deltas(response):
+                yield delta
+
+    async def _iter_stream_deltas(self,
+                                  response: aiohttp.ClientResponse) -> AsyncGenerator[str, None]:
+        """Yield the content deltas from a streamed chat completion."""
+        # Lines are matched as bytes, so keep-alives are skipped without decoding
+        async for line in response.content:
+            if not line.startswith(b"data: "):
+                continue
+            payload = line[6:].rstrip()
+            if payload == b"[DONE]":
+                break
+            delta = orjson.loads(payload)["choices"][0]["delta"].get("content")
+            if delta:
+                yield delta
 
     def get_available_models(self) -> List[str]:
         """Get list of available OpenAI models."""
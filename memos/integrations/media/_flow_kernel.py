@@ -0,0 +1,34 @@
+"""
+Compiled reductions over dense optical flow fields.
+"""
+
+from numba import njit, prange
+import numpy as np
+
+@njit(parallel=True, cache=True, fastmath=True)
+def average_blocks(flow: np.ndarray, block: int) -> np.ndarray:
+    """
+    Average flow vectors over non-overlapping square blocks.
+
+    Args:
+        flow: (H, W, C) float32 flow field; the first two channels are used.
+        block: Block size in pixels. Partial blocks at the edges are dropped.
+
+    Returns:
+        np.ndarray: (H // block, W // block, 2) float32 array of mean vectors.
+    """
+    rows = flow.shape[0] // block
+    cols = flow.shape[1] // block
+    inv_area = 1.0 / (block * block)
+    out = np.empty((rows, cols, 2), np.float32)
+    for i in prange(rows):
+        for j in range(cols):
+            ux = 0.0
+            uy = 0.0
+            for a in range(block):
+                for b in range(block):
+                    ux += flow[i * block + a, j * block + b, 0]
+                    uy += flow[i * block + a, j * block + b, 1]
+            out[i, j, 0] = ux * inv_area
+            out[i, j, 1] = uy * inv_area
+    return out
\ No newline at end of file
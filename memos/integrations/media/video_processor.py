@@ -2,6 +2,9 @@
 Video processing module for MemOS AI Framework.
 """
 
+import queue
+import threading
+
 import cv2
 import numpy as np
 from typing import Dict, Any, Optional, List, Tuple, Generator
@@ -9,7 +12,13 @@ from pathlib import Path
 from dataclasses import dataclass
 from datetime import timedelta
 
-@dataclass
+from memos.integrations.media._flow_kernel import average_blocks
+from memos.utils.compat import DATACLASS_SLOTS
+from memos.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+@dataclass(**DATACLASS_SLOTS)
 class VideoMetadata:
     """Container for video metadata."""
     width: int
@@ -24,7 +33,7 @@ class VideoMetadata:
     audio_channels: Optional[int] = None
     audio_sample_rate: Optional[int] = None
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class VideoFrame:
     """Container for video frames."""
     frame: np.ndarray
@@ -32,6 +41,186 @@ class VideoFrame:
     frame_number: int
     metadata: Optional[Dict[str, Any]] = None
 
+def _open_capture(video_path: str) -> cv2.VideoCapture:
+    """
+    Open a video with FFmpeg, requesting hardware decoding where available.
+
+    Falls back to OpenCV's default backend when the FFmpeg backend or the
+    capture parameters are not supported by the installed OpenCV.
+    """
+    try:
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [
+            cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+            cv2.CAP_PROP_HW_DEVICE, -1
+        ])
+    except (AttributeError, TypeError, cv2.error):
+        cap = None
+    
+    if cap is None or not cap.isOpened():
+        cap = cv2.VideoCapture(video_path)
+    
+    if cap.isOpened():
+        logger.debug("Opened %s with the %s backend", video_path, cap.getBackendName())
+    return cap
+
+def _cuda_available() -> bool:
+    """Check whether OpenCV can use a CUDA device."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+def _small_gray(frame: np.ndarray) -> np.ndarray:
+    """
+    Downsample a BGR frame to a quarter of its size and convert it to grayscale.
+
+    Mean frame differences barely change at this scale, while the diff
+    touches far fewer bytes than on the full color frame.
+    """
+    height, width = frame.shape[:2]
+    small = cv2.resize(frame, (max(1, width // 4), max(1, height // 4)),
+                       interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+class FileVideoStream:
+    """
+    Decodes frames from a capture on a background thread.
+
+    Frames are read ahead into a bounded queue, so decoding overlaps with
+    whatever the consumer does with each frame. Frames handed back through
+    ``release`` are decoded into again instead of allocating new buffers.
+    While the stream is running the capture must not be used by any other
+    thread.
+    """
+
+    # Seconds between checks of the stopped flag while blocked on the queue
+    _POLL_INTERVAL = 0.1
+
+    def __init__(self, cap: cv2.VideoCapture, queue_size: int = 128, stride: int = 1):
+        """
+        Initialize and start the stream at the capture's current position.
+
+        Args:
+            cap: Opened video capture to read from.
+            queue_size: Maximum number of decoded frames held ahead.
+            stride: Deliver only every ``stride``-th frame; the frames in
+                between are grabbed but never decoded to pixels.
+        """
+        self.cap = cap
+        self.stride = stride
+        # Frame numbers are counted instead of queried from the capture
+        self.position = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        # Released frame buffers, enough to cover every queued frame
+        self._free: queue.Queue = queue.Queue(maxsize=queue_size + 2)
+        self._stopped = threading.Event()
+        self._finished = False
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._update, daemon=True)
+        self._thread.start()
+
+    def _update(self) -> None:
+        """Decode frames into the queue until the video ends or the stream stops."""
+        start = frame_number = self.position
+        try:
+            while not self._stopped.is_set():
+                if not self.cap.grab():
+                    return
+                frame_number += 1
+                if (frame_number - start - 1) % self.stride:
+                    continue
+                
+                # Decode into a released buffer when one is available
+                try:
+                    buffer = self._free.get_nowait()
+                except queue.Empty:
+                    buffer = None
+                ret, frame = self.cap.retrieve(buffer)
+                if not ret:
+                    return
+                self._put((frame_number, frame))
+        except BaseException as e:
+            # Handed to the consumer, which would otherwise wait forever
+            self._error = e
+        finally:
+            self._put(None)
+
+    def _put(self, item: Optional[Tuple[int, np.ndarray]]) -> None:
+        """Queue an item, giving up if the stream is stopped while waiting."""
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=self._POLL_INTERVAL)
+                return
+            except queue.Full:
+                continue
+
+    def read(self) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        Get the next decoded frame.
+
+        Returns:
+            Optional[Tuple[int, np.ndarray]]: Frame number and frame, or None
+            at the end of the video or once the stream is stopped.
+
+        Raises:
+            Exception: Any error raised while decoding, once the frames
+                decoded before it have been read.
+        """
+        if self._finished:
+            return None
+        # Wake up periodically, since a stopped producer may never queue the sentinel
+        while True:
+            try:
+                item = self._queue.get(timeout=self._POLL_INTERVAL)
+                break
+            except queue.Empty:
+                if self._stopped.is_set():
+                    self._finished = True
+                    return None
+        if item is None:
+            self._finished = True
+            if self._error is not None:
+                raise self._error
+            return None
+        self.position = item[0]
+        return item
+
+    def release(self, frame: np.ndarray) -> None:
+        """
+        Hand a frame buffer back for reuse.
+
+        The caller must not use the array afterwards, since later frames
+        are decoded into it.
+
+        Args:
+            frame: Frame array previously returned by read().
+        """
+        # retrieve() can only decode into a contiguous buffer it may resize
+        if not frame.flags.c_contiguous or not frame.flags.owndata:
+            return
+        try:
+            self._free.put_nowait(frame)
+        except queue.Full:
+            pass
+
+    def stop(self) -> None:
+        """Stop decoding, wait for the background thread and wake any waiting reader."""
+        self._stopped.set()
+        self._thread.join()
+        try:
+            self._queue.put_nowait(None)
+        except queue.Full:
+            # The reader is not waiting and sees the stopped flag once drained
+            pass
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.stop()
+
 class VideoProcessor:
     """Video processing functionality."""
 
@@ -46,11 +235,26 @@ class VideoProcessor:
         if not self.video_path.exists():
             raise FileNotFoundError(f"Video file not found: {video_path}")
         
-        self.cap = cv2.VideoCapture(str(video_path))
+        self.cap = _open_capture(str(video_path))
         if not self.cap.isOpened():
             raise ValueError(f"Failed to open video: {video_path}")
         
         self.metadata = self._extract_metadata()
+        self._inv_fps = 1.0 / self.metadata.fps
+        
+        # Started on the first sequential read
+        self._stream: Optional[FileVideoStream] = None
+        
+        # Grayscale previous frame for optical flow, on the GPU when enabled
+        self._prev_gray = None
+        
+        # Dense optical flow runs on the GPU when OpenCV was built with CUDA
+        self._flow_gpu = None
+        if _cuda_available():
+            self._flow_gpu = cv2.cuda_FarnebackOpticalFlow.create(
+                3, 0.5, False, 15, 3, 5, 1.2, 0
+            )
+            self._frame_gpu = cv2.cuda_GpuMat()
 
     def _extract_metadata(self) -> VideoMetadata:
         """Extract video metadata."""
@@ -61,8 +265,8 @@ class VideoProcessor:
         duration = timedelta(seconds=total_frames/fps)
         
         # Get codec information
-        fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC))
-        codec = "".join([chr((fourcc >> 8 * i) & 0xFF) for i in range(4)])
+        fourcc = int(self.cap.get(cv2.CAP_PROP_FOURCC)) & 0xFFFFFFFF
+        codec = fourcc.to_bytes(4, 'little').decode('ascii', errors='replace').strip('\x00')
         
         return VideoMetadata(
             width=width,
@@ -85,12 +289,15 @@ class VideoProcessor:
         Returns:
             Optional[VideoFrame]: Next frame or None if end of video.
         """
-        ret, frame = self.cap.read()
-        if not ret:
+        if self._stream is None:
+            self._stream = FileVideoStream(self.cap)
+        
+        item = self._stream.read()
+        if item is None:
             return None
         
-        frame_number = int(self.cap.get(cv2.CAP_PROP_POS_FRAMES))
-        timestamp = timedelta(seconds=frame_number/self.metadata.fps)
+        frame_number, frame = item
+        timestamp = timedelta(seconds=frame_number * self._inv_fps)
         
         return VideoFrame(
             frame=frame,
@@ -111,6 +318,7 @@ class VideoProcessor:
             VideoFrame: Video frames.
         """
         if start_time is not None:
+            self._stop_stream()
             self.cap.set(cv2.CAP_PROP_POS_MSEC, start_time * 1000)
         
         while True:
@@ -127,93 +335,178 @@ class VideoProcessor:
         """
         Extract key frames from video.
 
+        Frames are compared as quarter-resolution grayscale images.
+
         Args:
-            threshold: Difference threshold for key frame detection.
+            threshold: Mean absolute difference (0-255) between downsampled
+                grayscale frames above which a frame is a key frame.
 
         Returns:
             List[VideoFrame]: List of key frames.
         """
         keyframes = []
-        prev_frame = None
+        prev_small = None
         
         while True:
             frame = self.read_frame()
             if frame is None:
                 break
             
-            if prev_frame is None:
+            small = _small_gray(frame.frame)
+            if prev_small is None:
                 keyframes.append(frame)
-                prev_frame = frame.frame
+                prev_small = small
                 continue
             
-            # Calculate frame difference
-            diff = np.mean(cv2.absdiff(frame.frame, prev_frame))
+            # Mean absolute difference without a temporary diff image
+            diff = cv2.norm(small, prev_small, cv2.NORM_L1) / small.size
             if diff > threshold:
                 keyframes.append(frame)
-                prev_frame = frame.frame
+                prev_small = small
+            else:
+                # Frames that are not kept can be decoded into again
+                self.release_frame(frame)
         
         return keyframes
 
-    def extract_scene_changes(self, threshold: float = 30.0) -> List[Tuple[timedelta, timedelta]]:
+    def extract_scene_changes(self, threshold: float = 30.0,
+                              stride: int = 1) -> List[Tuple[timedelta, timedelta]]:
         """
         Detect scene changes in video.
 
+        Frames are compared as quarter-resolution grayscale images. With a
+        stride above 1 only every ``stride``-th frame is decoded and
+        compared, so scene boundaries are placed to within ``stride`` frames.
+
         Args:
-            threshold: Threshold for scene change detection.
+            threshold: Mean absolute difference (0-255) between compared
+                downsampled grayscale frames above which a new scene starts.
+            stride: Number of frames between compared frames.
 
         Returns:
             List[Tuple[timedelta, timedelta]]: List of scene intervals.
         """
         scenes = []
         scene_start = timedelta()
-        prev_frame = None
+        last_timestamp = scene_start
+        prev_small = None
         
-        while True:
-            frame = self.read_frame()
-            if frame is None:
-                if scene_start is not None:
-                    scenes.append((scene_start, frame.timestamp))
-                break
-            
-            if prev_frame is None:
-                prev_frame = frame.frame
-                continue
-            
-            # Calculate frame difference
-            diff = np.mean(cv2.absdiff(frame.frame, prev_frame))
-            if diff > threshold:
-                if scene_start is not None:
+        # Skipped frames are only grabbed, never decoded to pixels
+        if stride > 1:
+            self._stop_stream()
+            self._stream = FileVideoStream(self.cap, stride=stride)
+        
+        try:
+            while True:
+                frame = self.read_frame()
+                if frame is None:
+                    scenes.append((scene_start, last_timestamp))
+                    break
+                
+                last_timestamp = frame.timestamp
+                
+                # Only the downsampled frame is kept, so the buffer is reused
+                small = _small_gray(frame.frame)
+                self.release_frame(frame)
+                if prev_small is None:
+                    prev_small = small
+                    continue
+                
+                # Mean absolute difference without a temporary diff image
+                diff = cv2.norm(small, prev_small, cv2.NORM_L1) / small.size
+                if diff > threshold:
                     scenes.append((scene_start, frame.timestamp))
-                scene_start = frame.timestamp
-            
-            prev_frame = frame.frame
+                    scene_start = frame.timestamp
+                
+                prev_small = small
+        finally:
+            # Later sequential reads get every frame again
+            if stride > 1:
+                self._stop_stream()
         
         return scenes
 
-    def extract_motion(self, frame: VideoFrame) -> np.ndarray:
+    def extract_motion(self, frame: VideoFrame, scale: float = 0.5,
+                       full_resolution: bool = True) -> np.ndarray:
         """
         Extract motion vectors from frame.
 
+        Flow is computed on frames resized by ``scale``, which cuts the cost
+        of Farneback's polynomial expansion roughly by the square of it.
+
         Args:
             frame: Input video frame.
+            scale: Resize factor applied before computing flow (0 < scale <= 1).
+            full_resolution: Whether to upsample the flow back to the frame
+                size, with vectors scaled to full-resolution pixels.
 
         Returns:
             np.ndarray: Motion vectors.
         """
+        if self._flow_gpu is not None:
+            flow = self._extract_motion_gpu(frame, scale)
+        else:
+            flow = self._extract_motion_cpu(frame, scale)
+        
+        if flow is None:
+            return np.zeros_like(frame.frame)
+        
+        if full_resolution and scale < 1.0:
+            height, width = frame.frame.shape[:2]
+            flow = cv2.resize(flow, (width, height)) * (1.0 / scale)
+        return flow
+
+    def extract_motion_reduced(self, frame: VideoFrame, block: int = 10,
+                               scale: float = 0.5) -> np.ndarray:
+        """
+        Extract motion vectors averaged over square blocks.
+
+        Averaging neighbouring vectors suppresses noise in the raw flow, and
+        the smaller grid is cheaper for downstream motion metrics.
+
+        Args:
+            frame: Input video frame.
+            block: Block size in full-resolution pixels.
+            scale: Resize factor applied before computing flow.
+
+        Returns:
+            np.ndarray: (H // block, W // block, 2) array of mean motion vectors.
+        """
+        flow = self.extract_motion(frame, scale=scale)
+        return average_blocks(np.ascontiguousarray(flow, dtype=np.float32), block)
+
+    def _extract_motion_cpu(self, frame: VideoFrame, scale: float) -> Optional[np.ndarray]:
+        """Compute optical flow on the CPU; returns None for the first frame."""
         # Convert to grayscale
         gray = cv2.cvtColor(frame.frame, cv2.COLOR_BGR2GRAY)
+        if scale < 1.0:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
         
-        # Calculate optical flow
-        if not hasattr(self, 'prev_gray'):
-            self.prev_gray = gray
-            return np.zeros_like(frame.frame)
+        # Calculate optical flow; a change of scale starts over
+        prev_gray, self._prev_gray = self._prev_gray, gray
+        if prev_gray is None or prev_gray.shape != gray.shape:
+            return None
         
-        flow = cv2.calcOpticalFlowFarneback(
-            self.prev_gray, gray, None, 0.5, 3, 15, 3, 5, 1.2, 0
+        return cv2.calcOpticalFlowFarneback(
+            prev_gray, gray, None, 0.5, 3, 15, 3, 5, 1.2, 0
         )
+
+    def _extract_motion_gpu(self, frame: VideoFrame, scale: float) -> Optional[np.ndarray]:
+        """Compute optical flow on the GPU, keeping the previous frame on device."""
+        self._frame_gpu.upload(frame.frame)
+        gray = cv2.cuda.cvtColor(self._frame_gpu, cv2.COLOR_BGR2GRAY)
+        if scale < 1.0:
+            width, height = gray.size()
+            gray = cv2.cuda.resize(
+                gray, (max(1, int(width * scale)), max(1, int(height * scale))),
+                interpolation=cv2.INTER_AREA
+            )
         
-        self.prev_gray = gray
-        return flow
+        prev_gray, self._prev_gray = self._prev_gray, gray
+        if prev_gray is None or prev_gray.size() != gray.size():
+            return None
+        
+        return self._flow_gpu.calc(prev_gray, gray, None).download()
 
     def save_frame(self, frame: VideoFrame, output_path: str) -> None:
         """
@@ -237,6 +530,7 @@ class VideoProcessor:
         Returns:
             np.ndarray: Thumbnail image.
         """
+        self._stop_stream()
         if timestamp is not None:
             self.cap.set(cv2.CAP_PROP_POS_MSEC, timestamp * 1000)
         
@@ -249,10 +543,40 @@ class VideoProcessor:
         
         return frame
 
+    def release_frame(self, frame: VideoFrame) -> None:
+        """
+        Return a frame's buffer so the next decoded frame can reuse it.
+
+        Only call this once the frame's pixels are no longer needed.
+
+        Args:
+            frame: Frame returned by read_frame().
+        """
+        if self._stream is not None:
+            self._stream.release(frame.frame)
+
+    def reset(self) -> None:
+        """Forget the previous frame so motion extraction starts afresh."""
+        self._prev_gray = None
+
+    def _stop_stream(self) -> None:
+        """Stop background decoding so the capture can be used directly."""
+        if self._stream is None:
+            return
+        
+        stream, self._stream = self._stream, None
+        stream.stop()
+        
+        # Rewind past frames that were decoded but never consumed
+        if int(self.cap.get(cv2.CAP_PROP_POS_FRAMES)) != stream.position:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, stream.position)
+
     def __enter__(self):
         """Context manager entry."""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
+        self._stop_stream()
+        self.reset()
         self.cap.release() 
\ No newline at end of file
@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 
+from memos.utils.compat import DATACLASS_SLOTS
+
 class MediaType(Enum):
     """Types of media content."""
     IMAGE = "image"
@@ -17,7 +19,7 @@ class MediaType(Enum):
     AUDIO = "audio"
     MIXED = "mixed"
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MediaContent:
     """Container for media content."""
     type: MediaType
@@ -25,7 +27,7 @@ class MediaContent:
     data: Optional[bytes] = None
     metadata: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SocialPost:
     """Container for social media posts."""
     platform: str
@@ -34,7 +36,7 @@ class SocialPost:
     timestamp: datetime = datetime.now()
     metadata: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Engagement:
     """Container for engagement metrics."""
     likes: int = 0
@@ -0,0 +1,10 @@
+"""
+Python version compatibility helpers for MemOS AI Framework.
+"""
+
+import sys
+
+# Keyword arguments for @dataclass that declare __slots__ where supported
+# (Python 3.10+), dropping the per-instance __dict__; older versions get
+# regular dataclasses
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
\ No newline at end of file
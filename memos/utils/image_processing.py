@@ -2,12 +2,13 @@
 Image processing utilities for MemOS AI Framework.
 """
 
-import cv2
 import numpy as np
-from PIL import Image
 from pathlib import Path
 from typing import Union, Tuple, Optional
 
+# OpenCV is imported by the functions that use it, so importing this
+# module (and so every entity) does not load it
+
 def load_image(image_path: Union[str, Path]) -> np.ndarray:
     """
     Load an image from file.
@@ -18,22 +19,45 @@ def load_image(image_path: Union[str, Path]) -> np.ndarray:
     Returns:
         np.ndarray: Image data as numpy array.
     """
+    import cv2
+    
     image_path = Path(image_path)
     if not image_path.exists():
         raise FileNotFoundError(f"Image file not found: {image_path}")
     
     # Read image using OpenCV
-    image = cv2.imread(str(image_path))
+    image = cv2.imread(str(image_path), cv2.IMREAD_COLOR)
     if image is None:
         raise ValueError(f"Failed to load image: {image_path}")
     
-    # Convert from BGR to RGB
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    # Convert from BGR to RGB in place, keeping the array contiguous
+    cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
+    return image
+
+def decode_image(data: bytes) -> np.ndarray:
+    """
+    Decode an encoded image (PNG, JPEG, ...) held in memory.
+
+    Args:
+        data: Encoded image bytes.
+
+    Returns:
+        np.ndarray: Image data as numpy array.
+    """
+    import cv2
+    
+    image = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Failed to decode image data")
+    
+    # Convert from BGR to RGB in place, keeping the array contiguous
+    cv2.cvtColor(image, cv2.COLOR_BGR2RGB, dst=image)
     return image
 
 def preprocess_image(image: np.ndarray, 
                     target_size: Optional[Tuple[int, int]] = None,
-                    normalize: bool = True) -> np.ndarray:
+                    normalize: bool = True,
+                    out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Preprocess an image for model input.
 
@@ -41,22 +65,25 @@ def preprocess_image(image: np.ndarray,
         image: Input image as numpy array.
         target_size: Optional target size (height, width).
         normalize: Whether to normalize pixel values.
+        out: Optional float32 buffer of the output shape to write into, so
+            callers processing many frames can reuse one allocation.
 
     Returns:
         np.ndarray: Preprocessed image.
     """
+    import cv2
+    
     # Resize if target size is specified
     if target_size is not None:
         image = cv2.resize(image, target_size[::-1])  # OpenCV uses (width, height)
     
-    # Convert to float32
-    image = image.astype(np.float32)
+    # Convert to float32 and normalize in a single pass
+    if out is None:
+        out = np.empty(image.shape, dtype=np.float32)
+    scale = np.float32(1.0 / 255.0) if normalize else np.float32(1.0)
+    np.multiply(image, scale, out=out, casting='unsafe')
     
-    # Normalize if requested
-    if normalize:
-        image = image / 255.0
-    
-    return image
+    return out
 
 def extract_features(image: np.ndarray) -> dict:
     """
@@ -68,24 +95,29 @@ def extract_features(image: np.ndarray) -> dict:
     Returns:
         dict: Dictionary of extracted features.
     """
+    import cv2
+    
     features = {}
     
     # Basic image properties
     features["height"], features["width"], features["channels"] = image.shape
     
-    # Color statistics
-    features["mean_color"] = image.mean(axis=(0, 1)).tolist()
-    features["std_color"] = image.std(axis=(0, 1)).tolist()
+    # Color statistics, both computed in a single pass
+    mean, std = cv2.meanStdDev(image)
+    features["mean_color"] = mean.ravel().tolist()
+    features["std_color"] = std.ravel().tolist()
     
     # Convert to grayscale for additional features
     gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
     
     # Edge detection
     edges = cv2.Canny(gray, 100, 200)
-    features["edge_density"] = edges.mean() / 255.0
+    features["edge_density"] = cv2.countNonZero(edges) / float(edges.size)
     
-    # Basic texture features using GLCM
-    features["contrast"] = cv2.convertScaleAbs(gray).std()
+    # Basic texture features; Canny already requires a uint8 image, so
+    # gray needs no conversion before taking its spread
+    _, std = cv2.meanStdDev(gray)
+    features["contrast"] = float(std[0, 0])
     
     return features
 
@@ -100,16 +132,27 @@ def save_image(image: np.ndarray,
         output_path: Path to save the image.
         format: Image format (e.g., "PNG", "JPEG").
     """
+    import cv2
+    
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Convert to PIL Image
     if image.dtype == np.float32 or image.dtype == np.float64:
         image = (image * 255).astype(np.uint8)
-    pil_image = Image.fromarray(image)
+    
+    # OpenCV encodes BGR(A); images in the framework are RGB(A)
+    if image.ndim == 3 and image.shape[2] == 3:
+        image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+    elif image.ndim == 3 and image.shape[2] == 4:
+        image = cv2.cvtColor(image, cv2.COLOR_RGBA2BGRA)
+    
+    # Encode by the requested format rather than the file extension
+    ok, encoded = cv2.imencode(f".{format.lower()}", image)
+    if not ok:
+        raise ValueError(f"Failed to encode image as {format}")
     
     # Save image
-    pil_image.save(str(output_path), format=format)
+    output_path.write_bytes(encoded.tobytes())
 
 def apply_transformations(image: np.ndarray,
                         rotate: Optional[float] = None,
@@ -129,25 +172,26 @@ def apply_transformations(image: np.ndarray,
     Returns:
         np.ndarray: Transformed image.
     """
-    result = image.copy()
+    import cv2
     
-    # Rotate
+    result = image
+    
+    # Rotate and flip in a single warp; a flip alone is a cheaper copy
     if rotate is not None:
         height, width = image.shape[:2]
         center = (width // 2, height // 2)
-        rotation_matrix = cv2.getRotationMatrix2D(center, rotate, 1.0)
-        result = cv2.warpAffine(result, rotation_matrix, (width, height))
-    
-    # Flip
-    if flip:
+        matrix = cv2.getRotationMatrix2D(center, rotate, 1.0)
+        if flip:
+            # Mirror x -> width - 1 - x after rotating
+            matrix = np.array([[-1.0, 0.0, width - 1], [0.0, 1.0, 0.0]]) @ np.vstack([matrix, [0.0, 0.0, 1.0]])
+        result = cv2.warpAffine(result, matrix, (width, height))
+    elif flip:
         result = cv2.flip(result, 1)  # 1 for horizontal flip
     
-    # Adjust brightness
-    if brightness is not None:
-        result = cv2.convertScaleAbs(result, alpha=brightness, beta=0)
-    
-    # Adjust contrast
-    if contrast is not None:
-        result = cv2.convertScaleAbs(result, alpha=contrast, beta=0)
+    # Brightness and contrast are both plain scales, applied in one pass
+    if brightness is not None or contrast is not None:
+        alpha = (1.0 if brightness is None else brightness) * (1.0 if contrast is None else contrast)
+        result = cv2.convertScaleAbs(result, alpha=alpha, beta=0)
     
-    return result 
\ No newline at end of file
+    # Never hand back the caller's array
+    return result.copy() if result is image else result
\ No newline at end of file
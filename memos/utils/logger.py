@@ -2,11 +2,20 @@
 Logger utility for MemOS AI Framework.
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 from pathlib import Path
 
+# Shared by every logger from get_logger; created on first use
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+_setup_lock = threading.Lock()
+
 def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
     Get a configured logger instance.
@@ -26,25 +35,47 @@ def get_logger(name: str, level: Optional[int] = None) -> logging.Logger:
             level = logging.INFO
         logger.setLevel(level)
         
-        # Create formatters and handlers
-        console_formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        
-        # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(console_formatter)
-        logger.addHandler(console_handler)
-        
-        # File handler
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-        
-        file_handler = logging.FileHandler(log_dir / "memos.log")
-        file_handler.setFormatter(console_formatter)
-        logger.addHandler(file_handler)
+        # Records are queued here and written by one background listener
+        logger.addHandler(_get_queue_handler())
         
         # Prevent propagation to root logger
         logger.propagate = False
     
-    return logger 
\ No newline at end of file
+    return logger
+
+def _get_queue_handler() -> QueueHandler:
+    """
+    Get the handler shared by all framework loggers, starting its listener.
+
+    Logging calls only enqueue the record; formatting and the console and
+    file writes happen on the listener's thread, so worker threads never
+    block on handler locks or disk I/O.
+    """
+    global _queue_handler, _listener
+    
+    with _setup_lock:
+        if _queue_handler is None:
+            # Create formatters and handlers
+            console_formatter = logging.Formatter(
+                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            )
+            
+            # Console handler
+            console_handler = logging.StreamHandler(sys.stdout)
+            console_handler.setFormatter(console_formatter)
+            
+            # File handler
+            log_dir = Path("logs")
+            log_dir.mkdir(exist_ok=True)
+            
+            file_handler = logging.FileHandler(log_dir / "memos.log")
+            file_handler.setFormatter(console_formatter)
+            
+            log_queue: queue.Queue = queue.Queue(-1)
+            _listener = QueueListener(log_queue, console_handler, file_handler)
+            _listener.start()
+            atexit.register(_listener.stop)
+            
+            _queue_handler = QueueHandler(log_queue)
+    
+    return _queue_handler
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Timestamp utilities for MemOS AI Framework.
+"""
+
+from datetime import datetime, timezone
+
+def utc_now() -> datetime:
+    """
+    Get the current time as a timezone-aware UTC datetime.
+
+    Returns:
+        datetime: The current UTC time.
+    """
+    return datetime.now(timezone.utc)
+
+def to_isoformat(timestamp_ns: int) -> str:
+    """
+    Format a nanosecond timestamp as an ISO 8601 string.
+
+    Args:
+        timestamp_ns: UTC timestamp in nanoseconds since the epoch.
+
+    Returns:
+        str: ISO 8601 representation with microsecond precision.
+    """
+    seconds, nanos = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, timezone.utc).replace(
+        microsecond=nanos // 1000
+    ).isoformat()
\ No newline at end of file
@@ -31,6 +31,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "numpy>=1.21.0",
+        "numba>=0.58.0",
         "torch>=2.0.0",
         "transformers>=4.30.0",
         "Pillow>=9.0.0",
@@ -40,13 +41,16 @@ setup(
         "spacy>=3.6.0",
         "fastapi>=0.100.0",
         "uvicorn>=0.23.0",
+        "uvloop>=0.17.0; sys_platform != 'win32'",
         "python-multipart>=0.0.6",
         "pydantic>=2.0.0",
+        "orjson>=3.9.0",
         "requests>=2.31.0",
         "aiohttp>=3.8.5",
         "sqlalchemy>=2.0.0",
         "alembic>=1.11.0",
         "redis>=4.6.0",
+        "fastapi-cache2>=0.2.1",
         "celery>=5.3.0"
     ],
     extras_require={
@@ -0,0 +1,105 @@
+"""
+Tests for the MemOS AI HTTP API.
+"""
+
+import cv2
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from memos.api import app, config
+
+@pytest.fixture
+def client():
+    """Fixture for an API client with the app's lifespan running."""
+    with TestClient(app) as client:
+        yield client
+
+@pytest.fixture
+def image_bytes():
+    """Fixture for an encoded sample image."""
+    image = np.random.randint(0, 255, (224, 224, 3), dtype=np.uint8)
+    ok, encoded = cv2.imencode(".png", image)
+    assert ok
+    return encoded.tobytes()
+
+def _upload(client, image_bytes):
+    """Upload a meme and return its status."""
+    response = client.post("/memes/upload", files={"file": ("meme.png", image_bytes, "image/png")})
+    assert response.status_code == 200
+    return response.json()
+
+def test_upload_meme(client, image_bytes):
+    """Test uploading a meme returns its status."""
+    status = _upload(client, image_bytes)
+    
+    assert status["status"] == "active"
+    assert isinstance(status["creation_time"], str)
+    assert status["last_interaction_time"] is None
+    assert isinstance(status["metadata"], dict)
+
+def test_upload_rejects_oversized_file(client, monkeypatch):
+    """Test that uploads above the configured size limit are rejected."""
+    monkeypatch.setitem(config._flat, "api.max_upload_size", 1)
+    data = b"\0" * (1024 * 1024 + 1)
+    
+    response = client.post("/memes/upload", files={"file": ("meme.png", data, "image/png")})
+    
+    assert response.status_code == 413
+
+def test_get_meme_status(client, image_bytes):
+    """Test retrieving the status of an uploaded meme."""
+    entity_id = _upload(client, image_bytes)["id"]
+    
+    response = client.get(f"/memes/{entity_id}")
+    assert response.status_code == 200
+    assert response.json()["id"] == entity_id
+    
+    assert client.get("/memes/invalid_id").status_code == 404
+
+def test_list_memes(client, image_bytes):
+    """Test listing active memes."""
+    entity_id = _upload(client, image_bytes)["id"]
+    
+    response = client.get("/memes")
+    assert response.status_code == 200
+    assert entity_id in [status["id"] for status in response.json()]
+
+def test_mutations_invalidate_cache(client, image_bytes):
+    """Test that cached responses are dropped after a mutation."""
+    entity_id = _upload(client, image_bytes)["id"]
+    assert client.get(f"/memes/{entity_id}").json()["last_interaction_time"] is None
+    listed = [status["id"] for status in client.get("/memes").json()]
+    
+    # An interaction is visible in the next status response
+    response = client.post(
+        f"/memes/{entity_id}/interact",
+        json={"type": "praise", "content": "nice"}
+    )
+    assert response.status_code == 200
+    assert client.get(f"/memes/{entity_id}").json()["last_interaction_time"] is not None
+    
+    # New and deactivated entities are visible in the next list response
+    other_id = _upload(client, image_bytes)["id"]
+    assert [status["id"] for status in client.get("/memes").json()] == listed + [other_id]
+    
+    assert client.delete(f"/memes/{entity_id}").status_code == 200
+    assert client.get(f"/memes/{entity_id}").status_code == 404
+    assert entity_id not in [status["id"] for status in client.get("/memes").json()]
+
+def test_stream_is_not_compressed(client, image_bytes):
+    """Test that event streams bypass gzip so events arrive as they are sent."""
+    entity_id = _upload(client, image_bytes)["id"]
+    
+    with client.stream(
+        "POST",
+        f"/memes/{entity_id}/interact/stream",
+        json={"type": "praise", "content": "nice"},
+        headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "content-encoding" not in response.headers
+        events = [line for line in response.iter_lines() if line.startswith("event: ")]
+    
+    assert events == ["event: emotion", "event: response"]
\ No newline at end of file
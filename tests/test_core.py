@@ -2,13 +2,17 @@
 Tests for core MemOS AI functionality.
 """
 
+import io
+
 import pytest
 import numpy as np
+import orjson
 from pathlib import Path
 
 from memos.core import MemOSEngine
-from memos.entities import MemeEntity
+from memos.entities import MemeEntity, Context, EmotionalState, EntityCollection
 from memos.config import Config
+from memos.core._pools import ContextPool
 
 @pytest.fixture
 def config():
@@ -37,6 +41,17 @@ def test_meme_entity_creation(sample_image):
     assert entity.id is not None
     assert entity.image_data is not None
 
+def test_meme_entity_from_bytes(sample_image):
+    """Test meme entity creation from encoded image bytes."""
+    import cv2
+    
+    encoded = cv2.imencode(".png", sample_image)[1].tobytes()
+    entity = MemeEntity.from_bytes(encoded)
+    assert entity.image_data.shape == sample_image.shape
+    
+    with pytest.raises(ValueError):
+        MemeEntity.from_bytes(b"not an image")
+
 def test_meme_activation(engine, sample_image):
     """Test meme activation."""
     entity = MemeEntity.from_array(sample_image)
@@ -44,6 +59,17 @@ def test_meme_activation(engine, sample_image):
     assert success
     assert entity.id in engine.get_active_entities()
 
+def test_is_active(engine, sample_image):
+    """Test active entity membership checks."""
+    entity = MemeEntity.from_array(sample_image)
+    assert not engine.is_active(entity.id)
+    
+    engine.activate(entity)
+    assert engine.is_active(entity.id)
+    
+    engine.deactivate(entity.id)
+    assert not engine.is_active(entity.id)
+
 def test_meme_interaction(engine, sample_image):
     """Test meme interaction."""
     entity = MemeEntity.from_array(sample_image)
@@ -57,6 +83,54 @@ def test_meme_interaction(engine, sample_image):
     
     response = engine.interact(entity.id, interaction)
     assert response is not None
+    assert response["entity_id"] == entity.id
+    assert entity.last_interaction_time is not None
+
+def test_emotion_process_batch(engine, sample_image):
+    """Test batched emotional updates, including repeated entities."""
+    entities = [MemeEntity.from_array(sample_image) for _ in range(2)]
+    for entity in entities:
+        engine.activate(entity)
+    
+    memes = [entities[0], entities[1], entities[0]]
+    interactions = [{"type": "text", "content": str(i)} for i in range(3)]
+    responses = engine.emotion_engine.process_batch(memes, interactions)
+    
+    assert len(responses) == 3
+    for entity in entities:
+        state = entity.get_emotional_state()
+        assert state["current_emotions"].shape == (8,)
+
+def test_impact_table(config):
+    """Test interaction impacts looked up from the configured table."""
+    config.set("impact_table", {"praise": [0.2, 0, 0, 0, 0, 0, 0.1, 0]})
+    emotion_engine = MemOSEngine(config).emotion_engine
+    
+    impact = emotion_engine._analyze_emotional_impact("praise")
+    assert impact[0] == pytest.approx(0.2)
+    assert not emotion_engine._analyze_emotional_impact("unknown").any()
+
+def test_activation_cache(config, sample_image, tmp_path):
+    """Test that repeated activations are restored from the snapshot cache."""
+    config.set("storage.activation_cache.enabled", True)
+    config.set("storage.activation_cache.dir", str(tmp_path))
+    engine = MemOSEngine(config)
+    
+    first = MemeEntity.from_array(sample_image)
+    second = MemeEntity.from_array(sample_image)
+    assert engine.activate(first)
+    assert engine.activate(second)
+    
+    assert len(list(tmp_path.glob("*/*.pkl"))) == 1
+    assert second.metadata["processed"]
+    assert second.get_context() is not first.get_context()
+    
+    # Settings unrelated to activation share the snapshots
+    config.set("api.port", 9000)
+    assert MemOSEngine(config).activate(MemeEntity.from_array(sample_image))
+    snapshots = list(tmp_path.glob("*/*.pkl"))
+    assert len(snapshots) == 1
+    assert engine.activation_cache._size == snapshots[0].stat().st_size
 
 def test_meme_deactivation(engine, sample_image):
     """Test meme deactivation."""
@@ -76,6 +150,131 @@ def test_entity_status(engine, sample_image):
     assert status is not None
     assert status["id"] == entity.id
     assert status["status"] == "active"
+    
+    # Internal nanosecond timestamps are formatted on output
+    engine.interact(entity.id, {"type": "praise"})
+    context = engine.get_entity_status(entity.id)["context"]
+    assert isinstance(context["creation_time"], str)
+    assert isinstance(context["last_interaction"], str)
+    assert isinstance(context["interaction_history"][0]["timestamp"], str)
+
+def test_entity_statuses(engine, sample_image):
+    """Test batched entity status retrieval."""
+    entities = [MemeEntity.from_array(sample_image) for _ in range(3)]
+    for entity in entities:
+        engine.activate(entity)
+    
+    ids = [entity.id for entity in entities]
+    statuses = engine.get_entity_statuses(ids)
+    assert [status["id"] for status in statuses] == ids
+    
+    with pytest.raises(ValueError):
+        engine.get_entity_statuses(ids + ["invalid_id"])
+
+def test_context_pool():
+    """Test context reuse through the pool."""
+    pool = ContextPool()
+    context = pool.acquire()
+    context["key"] = "value"
+    
+    pool.release(context)
+    reused = pool.acquire()
+    assert reused is context
+    assert reused == {}
+    assert pool.acquire() is not context
+
+def test_context_history_bounded():
+    """Test that interaction history keeps only the latest entries."""
+    context = Context(history_max=3)
+    for i in range(5):
+        context.add_interaction({"index": i})
+    
+    assert [item["index"] for item in context.get_recent_interactions()] == [2, 3, 4]
+    assert [item["index"] for item in context.get_recent_interactions(2)] == [3, 4]
+
+def test_context_to_dict_timestamps():
+    """Test that context timestamps are serialized as UTC ISO strings."""
+    context = Context()
+    context.add_interaction({"type": "praise"})
+    
+    data = context.to_dict()
+    
+    assert data["creation_time"].endswith("+00:00")
+    assert data["interaction_history"][0]["timestamp"].endswith("+00:00")
+    assert isinstance(context.get_recent_interactions()[0]["timestamp"], int)
+
+def test_emotional_state_mood():
+    """Test emotion updates and the derived mood."""
+    state = EmotionalState()
+    state.update_emotion("joy", 0.9)
+    state.update_emotion("sadness", 0.3)
+    
+    assert state.get_emotion("joy") == pytest.approx(0.9)
+    assert state.get_dominant_emotion()[0] == "joy"
+    assert state.get_mood() == pytest.approx(0.9 / 3 - 0.3 / 4)
+    assert state.emotions["sadness"] == pytest.approx(0.3)
+    
+    # Unchanged values are not recorded again
+    state.update_emotion("joy", 0.9)
+    assert len(state.get_emotional_history()) == 2
+    
+    with pytest.raises(ValueError):
+        state.update_emotion("boredom", 0.5)
+    
+    moods = EmotionalState.update_mood_batch(state._emotions[np.newaxis, :])
+    assert moods[0] == pytest.approx(state.get_mood(), abs=1e-6)
+
+def test_emotional_state_dump_json():
+    """Test that streamed JSON output matches to_dict."""
+    state = EmotionalState()
+    state.update_emotion("joy", 0.5)
+    state.update_emotion("fear", 0.25)
+    
+    buffer = io.BytesIO()
+    state.dump_json(buffer)
+    assert orjson.loads(buffer.getvalue()) == orjson.loads(orjson.dumps(state.to_dict()))
+    assert len(list(state.iter_history_records())) == 2
+
+def test_entity_collection(sample_image):
+    """Test batch mood updates through the columnar collection."""
+    entities = [MemeEntity.from_array(sample_image) for _ in range(3)]
+    state = EmotionalState()
+    state.update_emotion("joy", 0.6)
+    entities[0].set_emotional_state(state)
+    
+    collection = EntityCollection.from_entities(entities)
+    assert len(collection) == 3
+    assert collection.row(entities[2].id) == 2
+    
+    collection.emotions[1, EmotionalState.CORE_INDEX["sadness"]] = 0.8
+    moods = collection.update_mood_all()
+    assert moods[0] == pytest.approx(0.2, abs=1e-6)
+    assert moods[1] == pytest.approx(-0.2, abs=1e-6)
+    
+    collection.to_entities()
+    assert entities[1].get_emotional_state().get_emotion("sadness") == pytest.approx(0.8)
+    assert entities[1].get_emotional_state().get_mood() == pytest.approx(-0.2, abs=1e-6)
+
+def test_entity_collection_engine_states(engine, sample_image):
+    """Test the collection with the dict states of engine-activated memes."""
+    active = MemeEntity.from_array(sample_image)
+    deactivated = MemeEntity.from_array(sample_image)
+    for entity in (active, deactivated):
+        engine.activate(entity)
+    engine.deactivate(deactivated.id)
+    
+    collection = EntityCollection.from_entities([active, deactivated])
+    collection.emotions[0, EmotionalState.CORE_INDEX["joy"]] = 0.9
+    assert collection.update_mood_all()[0] == pytest.approx(0.3, abs=1e-6)
+    
+    collection.to_entities()
+    assert active.get_emotional_state()["current_emotions"][0] == pytest.approx(0.9)
+    assert isinstance(deactivated.get_emotional_state(), EmotionalState)
+
+def test_entity_slots(sample_image):
+    """Test that entity classes do not carry a per-instance __dict__."""
+    for instance in (MemeEntity.from_array(sample_image), Context(), EmotionalState()):
+        assert not hasattr(instance, "__dict__")
 
 def test_invalid_entity_id(engine):
     """Test handling of invalid entity ID."""
@@ -0,0 +1,76 @@
+"""
+Tests for video processing.
+"""
+
+import threading
+
+import numpy as np
+import pytest
+
+from memos.integrations.media.video_processor import FileVideoStream
+
+class _FailingCapture:
+    """Capture that decodes a few frames and then raises."""
+
+    def __init__(self, frames: int):
+        self.frames = frames
+
+    def get(self, prop):
+        return 0
+
+    def grab(self):
+        return True
+
+    def retrieve(self, image=None):
+        if self.frames == 0:
+            raise RuntimeError("decode failed")
+        self.frames -= 1
+        return True, np.zeros((4, 4, 3), dtype=np.uint8)
+
+class _StalledCapture:
+    """Capture whose grab blocks until it is unblocked."""
+
+    def __init__(self):
+        self.unblock = threading.Event()
+
+    def get(self, prop):
+        return 0
+
+    def grab(self):
+        self.unblock.wait()
+        return True
+
+    def retrieve(self, image=None):
+        return True, np.zeros((4, 4, 3), dtype=np.uint8)
+
+def test_stream_reraises_decode_errors():
+    """Test that a decoding error reaches the reader instead of hanging it."""
+    with FileVideoStream(_FailingCapture(frames=2)) as stream:
+        assert stream.read()[0] == 1
+        assert stream.read()[0] == 2
+        with pytest.raises(RuntimeError):
+            stream.read()
+        assert stream.read() is None
+
+def test_stream_ignores_non_contiguous_buffers():
+    """Test that views are not handed back to the decoder."""
+    with FileVideoStream(_FailingCapture(frames=1)) as stream:
+        _, frame = stream.read()
+        stream.release(frame[:, ::2])
+        assert stream._free.empty()
+
+def test_stop_wakes_waiting_reader():
+    """Test that stopping the stream unblocks a reader waiting for a frame."""
+    cap = _StalledCapture()
+    stream = FileVideoStream(cap)
+    results = []
+    reader = threading.Thread(target=lambda: results.append(stream.read()))
+    reader.start()
+    
+    # The producer only notices the stop after its pending grab returns
+    threading.Timer(0.2, cap.unblock.set).start()
+    stream.stop()
+    reader.join(timeout=5)
+    
+    assert not reader.is_alive()
+    assert results == [None]
\ No newline at end of file